@@ -17,6 +17,7 @@ setup(
     url="https://github.com/your-username/dual_stock_adviser",
     package_dir={"": "src"},
     packages=find_packages(where="src"),
+    package_data={"stock_adviser": ["resources/backstories/*.md"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Financial and Insurance Industry",
@@ -35,7 +36,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.4.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=1.1.0",
             "pytest-cov>=4.1.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
@@ -1,141 +1,61 @@
+import asyncio
+import logging
+import hashlib
+import re
+import time
 from crewai import Agent, Task, Crew, Process
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from decimal import Decimal
 
 from ..models import (
-    RecommendationType, RiskLevel, AgentAnalysis, PriceTarget, 
+    RecommendationType, RiskLevel, AgentAnalysis, PriceTarget,
     InvestmentRationale, PerformanceMetrics, StockAnalysisResult
 )
-from ..utils import app_logger, analysis_logger
+from ..utils import app_logger, analysis_logger, settings, llm_cache, today_str
 
 
-class InvestmentAdvisorAgent:
-    """투자 자문가 (Manager Role)"""
-    
-    def __init__(self, tools: List[Any] = None):
-        self.tools = tools or []
-        self.agent = self._create_agent()
-        
-    def _create_agent(self) -> Agent:
-        """Manager Agent 생성"""
-        return Agent(
-            role="Senior Investment Advisor",
-            goal="다양한 분석 결과를 종합하여 최적의 투자 의사결정과 전략을 제공한다.",
-            backstory="""
-            당신은 25년 경력의 시니어 투자 자문가로, 국내외 주요 자산운용사에서
-            포트폴리오 매니저와 투자 전략 책임자를 역임했습니다.
-            
-            CFA(Chartered Financial Analyst) 자격을 보유하고 있으며,
-            한국과 미국 시장에서 일관되게 우수한 성과를 거두어왔습니다.
-            
-            전문 분야:
-            - 멀티 팩터 투자 전략
-            - 글로벌 자산 배분
-            - 리스크 조정 수익률 최적화
-            - 행동 금융학 기반 투자 심리 분석
-            - ESG 투자 전략
-            
-            투자 철학:
-            - 장기적 가치 창출 중시
-            - 리스크 대비 수익률 최적화
-            - 분산 투자의 중요성 인식
-            - 시장 효율성과 비효율성의 균형적 이해
-            - 투자자 개인의 목표와 성향 존중
-            
-            항상 객관적이고 균형잡힌 시각으로 투자 의견을 제시하며,
-            다른 전문가들의 의견을 종합하여 최종 판단을 내립니다.
-            """,
-            verbose=True,
-            allow_delegation=True,  # Manager 역할이므로 delegation 허용
-            tools=self.tools,
-            max_iter=5
-        )
-    
-    def create_investment_analysis_task(
-        self, 
-        symbol: str, 
-        company_name: str, 
-        market: str,
-        sentiment_analysis: Optional[AgentAnalysis] = None,
-        risk_analysis: Optional[AgentAnalysis] = None,
-        user_profile: Optional[Dict] = None
-    ) -> Task:
-        """투자 분석 통합 태스크 생성"""
-        
-        user_context = ""
-        if user_profile:
-            risk_tolerance = user_profile.get('risk_tolerance', 'medium')
-            investment_horizon = user_profile.get('investment_horizon', 'medium_term')
-            investment_style = user_profile.get('investment_style', 'moderate')
-            
-            user_context = f"""
-            투자자 프로필:
-            - 위험 허용도: {risk_tolerance}
-            - 투자 기간: {investment_horizon}  
-            - 투자 스타일: {investment_style}
-            """
-        
-        sentiment_context = ""
-        if sentiment_analysis:
-            sentiment_context = f"""
-            시장 심리 분석 결과:
-            - 전문가: {sentiment_analysis.agent_name}
-            - 요약: {sentiment_analysis.summary}
-            - 주요 포인트: {', '.join(sentiment_analysis.key_points)}
-            - 신뢰도: {float(sentiment_analysis.confidence_score):.1%}
-            """
-            
-        risk_context = ""
-        if risk_analysis:
-            risk_context = f"""
-            리스크 분석 결과:
-            - 전문가: {risk_analysis.agent_name}
-            - 요약: {risk_analysis.summary}
-            - 주요 포인트: {', '.join(risk_analysis.key_points)}
-            - 신뢰도: {float(risk_analysis.confidence_score):.1%}
-            """
-        
-        return Task(
-            description=f"""
-            {company_name} ({symbol})에 대한 종합적인 투자 분석을 수행하고 
+# 불변 태스크 템플릿 (임포트 시 1회 구성, 호출마다 재조립하지 않음)
+_INVESTMENT_TASK_DESCRIPTION = """
+            {company_name} ({symbol})에 대한 종합적인 투자 분석을 수행하고
             최종 투자 추천을 제시하세요.
-            
+
             {user_context}
-            
+
             분석 통합 과정:
             1. 기존 분석 결과 검토
             {sentiment_context}
-            
+
             {risk_context}
-            
+
             2. 추가 분석 수행
                - 기술적 분석 (차트 패턴, 기술 지표)
                - 기본적 분석 (재무제표, 밸류에이션)
                - 동종업계 비교 분석
                - 거시경제 환경 분석
-               
+
             3. 종합 투자 의견 도출
                - 매수/매도/중립 추천
                - 목표가 설정 (진입가, 목표가, 손절가)
                - 투자 기간별 전략
                - 포지션 사이징 권고
-               
+
             4. 시나리오 분석
                - 베이스 케이스 (확률 60%)
-               - 불 케이스 (확률 20%)  
+               - 불 케이스 (확률 20%)
                - 베어 케이스 (확률 20%)
-               
+
             5. 투자자별 맞춤 조언
                - 보수적 투자자를 위한 조언
                - 공격적 투자자를 위한 조언
                - 리스크 관리 방안
-               
+
             Market: {market}
-            분석 기준일: {datetime.now().strftime('%Y-%m-%d')}
-            """,
-            agent=self.agent,
-            expected_output="""
+            분석 기준일: {analysis_date}
+            """
+
+_INVESTMENT_TASK_EXPECTED_OUTPUT = """
             투자 분석 결과를 다음 JSON 형태로 제공:
             {
                 "recommendation": "strong_buy/buy/hold/sell/strong_sell",
@@ -160,7 +80,7 @@ class InvestmentAdvisorAgent:
                 },
                 "scenario_analysis": {
                     "base_case": {"probability": 0.6, "return": "수익률", "description": "설명"},
-                    "bull_case": {"probability": 0.2, "return": "수익률", "description": "설명"},  
+                    "bull_case": {"probability": 0.2, "return": "수익률", "description": "설명"},
                     "bear_case": {"probability": 0.2, "return": "수익률", "description": "설명"}
                 },
                 "portfolio_advice": {
@@ -175,6 +95,135 @@ class InvestmentAdvisorAgent:
                 }
             }
             """
+
+
+# 핵심 필드 조기 추출용 패턴 (전체 JSON 완성을 기다리지 않음)
+_RECOMMENDATION_PATTERN = re.compile(
+    r'"recommendation"\s*:\s*"(strong_buy|strong_sell|buy|hold|sell)"'
+)
+_CONFIDENCE_PATTERN = re.compile(r'"confidence_level"\s*:\s*([01](?:\.\d+)?)')
+
+
+def _extract_early_fields(raw_result: Any) -> tuple:
+    """부분/잘린 LLM 출력에서 추천과 신뢰도를 조기 추출
+
+    응답 JSON이 완성되지 않았거나 뒷부분이 잘렸더라도 의사결정에 필요한
+    핵심 필드만 먼저 회수한다. 찾지 못한 필드는 None.
+    """
+    text = str(raw_result)
+
+    rec_match = _RECOMMENDATION_PATTERN.search(text)
+    conf_match = _CONFIDENCE_PATTERN.search(text)
+
+    recommendation = RecommendationType(rec_match.group(1)) if rec_match else None
+    confidence_level = Decimal(conf_match.group(1)) if conf_match else None
+
+    return recommendation, confidence_level
+
+
+@lru_cache(maxsize=4)
+def _build_advisor_agent(tools: tuple) -> Agent:
+    """동일 도구 구성에 대해 Manager Agent를 재사용 (대형 backstory 재구성 방지)"""
+    return Agent(
+        role="Senior Investment Advisor",
+        goal="다양한 분석 결과를 종합하여 최적의 투자 의사결정과 전략을 제공한다.",
+        # 토큰 절약을 위한 요약 backstory — 전체 프로필은
+        # resources/backstories/investment_advisor.md (get_backstory 참조)
+        backstory="25년 경력의 CFA 시니어 투자 자문가. 멀티 팩터 전략과 "
+                  "글로벌 자산 배분에 정통하며, 전문가 의견을 종합해 "
+                  "리스크 대비 수익률을 최적화한 균형잡힌 최종 판단을 내린다.",
+        verbose=settings.crewai_verbose,
+        allow_delegation=True,  # Manager 역할이므로 delegation 허용
+        tools=list(tools),
+        max_iter=5
+    )
+
+
+class InvestmentAdvisorAgent:
+    """투자 자문가 (Manager Role)"""
+
+    def __init__(self, tools: List[Any] = None):
+        self.tools = tools or []
+        self.agent = self._create_agent()
+        # LLM 동시 호출 수 제한 (Provider RPM 한도 보호)
+        self._llm_semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+        # 재사용 Crew (첫 분석 시 생성)
+        self._crew: Optional[Crew] = None
+
+    def _create_agent(self) -> Agent:
+        """Manager Agent 생성 (동일 도구 구성이면 캐시 재사용)"""
+        return _build_advisor_agent(tuple(self.tools))
+
+    def _get_crew(self, task: Task) -> Crew:
+        """Crew 재사용 — 프레임워크 검증·설정 비용을 첫 호출에만 지불"""
+        if self._crew is None:
+            self._crew = Crew(
+                agents=[self.agent],
+                tasks=[task],
+                process=Process.hierarchical,
+                manager_llm=settings.manager_llm,  # 매니저용 LLM (배포별 오버라이드 가능)
+                verbose=settings.crewai_verbose
+            )
+        else:
+            self._crew.tasks = [task]
+        return self._crew
+
+    def create_investment_analysis_task(
+        self, 
+        symbol: str, 
+        company_name: str, 
+        market: str,
+        sentiment_analysis: Optional[AgentAnalysis] = None,
+        risk_analysis: Optional[AgentAnalysis] = None,
+        user_profile: Optional[Dict] = None
+    ) -> Task:
+        """투자 분석 통합 태스크 생성"""
+        
+        user_context = ""
+        if user_profile:
+            risk_tolerance = user_profile.get('risk_tolerance', 'medium')
+            investment_horizon = user_profile.get('investment_horizon', 'medium_term')
+            investment_style = user_profile.get('investment_style', 'moderate')
+            
+            user_context = f"""
+            투자자 프로필:
+            - 위험 허용도: {risk_tolerance}
+            - 투자 기간: {investment_horizon}  
+            - 투자 스타일: {investment_style}
+            """
+        
+        sentiment_context = ""
+        if sentiment_analysis:
+            sentiment_context = f"""
+            시장 심리 분석 결과:
+            - 전문가: {sentiment_analysis.agent_name}
+            - 요약: {sentiment_analysis.summary}
+            - 주요 포인트: {', '.join(sentiment_analysis.key_points)}
+            - 신뢰도: {float(sentiment_analysis.confidence_score):.1%}
+            """
+            
+        risk_context = ""
+        if risk_analysis:
+            risk_context = f"""
+            리스크 분석 결과:
+            - 전문가: {risk_analysis.agent_name}
+            - 요약: {risk_analysis.summary}
+            - 주요 포인트: {', '.join(risk_analysis.key_points)}
+            - 신뢰도: {float(risk_analysis.confidence_score):.1%}
+            """
+        
+        return Task(
+            description=_INVESTMENT_TASK_DESCRIPTION.format(
+                company_name=company_name,
+                symbol=symbol,
+                user_context=user_context,
+                sentiment_context=sentiment_context,
+                risk_context=risk_context,
+                market=market,
+                analysis_date=today_str()
+            ),
+            agent=self.agent,
+            expected_output=_INVESTMENT_TASK_EXPECTED_OUTPUT
         )
     
     def analyze_investment(
@@ -189,27 +238,38 @@ class InvestmentAdvisorAgent:
     ) -> StockAnalysisResult:
         """종합 투자 분석 실행"""
         analysis_logger.log_analysis_start(symbol, "investment_advisor")
-        start_time = datetime.now()
-        
+        start_time = time.perf_counter()
+
+        # 동일 입력·동일 날짜 재분석은 LLM 호출 없이 캐시에서 반환
+        cache_key = None
+        if settings.cache_enabled:
+            cache_key = llm_cache.make_key(
+                analysis_type="investment",
+                symbol=symbol,
+                market=market,
+                date=today_str(),
+                sentiment=sentiment_analysis.summary if sentiment_analysis else None,
+                risk=risk_analysis.summary if risk_analysis else None,
+                user_profile=user_profile
+            )
+            cached_result = llm_cache.get(cache_key)
+            if cached_result is not None:
+                app_logger.info(f"LLM 캐시 적중: {symbol} (investment)")
+                return cached_result
+
         try:
             # 태스크 생성
             investment_task = self.create_investment_analysis_task(
                 symbol, company_name, market, sentiment_analysis, risk_analysis, user_profile
             )
             
-            # Crew 생성 및 실행 (hierarchical process로 매니저 역할 수행)
-            crew = Crew(
-                agents=[self.agent],
-                tasks=[investment_task],
-                process=Process.hierarchical,
-                manager_llm="gpt-4",  # 매니저용 LLM
-                verbose=True
-            )
-            
+            # 재사용 Crew에 태스크 장착 후 실행 (hierarchical process로 매니저 역할 수행)
+            crew = self._get_crew(investment_task)
+
             # 분석 실행
             result = crew.kickoff()
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             # 결과 파싱 및 StockAnalysisResult 생성
             analysis_result = self._create_analysis_result(
@@ -217,19 +277,54 @@ class InvestmentAdvisorAgent:
                 sentiment_analysis, risk_analysis, processing_time
             )
             
-            analysis_logger.log_analysis_complete(symbol, analysis_result.to_dict(), processing_time)
+            if analysis_logger.logger.isEnabledFor(logging.INFO):
+                analysis_logger.log_analysis_complete(symbol, analysis_result.to_dict(), processing_time)
             analysis_logger.log_agent_execution("Investment Advisor", symbol, processing_time, True)
-            
+
+            if cache_key:
+                llm_cache.set(cache_key, analysis_result)
+
             return analysis_result
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             analysis_logger.log_analysis_error(symbol, e)
             analysis_logger.log_agent_execution("Investment Advisor", symbol, processing_time, False)
             
             # 에러 시 기본 결과 반환
             return self._create_default_analysis_result(symbol, company_name, current_price, str(e))
     
+    async def analyze_investment_async(
+        self,
+        symbol: str,
+        company_name: str,
+        current_price: Decimal,
+        market: str,
+        sentiment_analysis: Optional[AgentAnalysis] = None,
+        risk_analysis: Optional[AgentAnalysis] = None,
+        user_profile: Optional[Dict] = None
+    ) -> StockAnalysisResult:
+        """analyze_investment의 비동기 래퍼
+
+        crew.kickoff()가 블로킹 네트워크 호출이므로 스레드로 넘기고,
+        세마포어로 동시 LLM 호출 수를 제한한다.
+        """
+        async with self._llm_semaphore:
+            return await asyncio.to_thread(
+                self.analyze_investment,
+                symbol, company_name, current_price, market,
+                sentiment_analysis, risk_analysis, user_profile
+            )
+
+    async def analyze_batch(self, requests: List[Dict[str, Any]]) -> List[StockAnalysisResult]:
+        """여러 종목의 투자 분석을 동시 실행
+
+        requests의 각 항목은 analyze_investment의 키워드 인자 딕셔너리.
+        N개 종목의 대기 시간이 N·T에서 대략 T(동시성 한도 내)로 줄어든다.
+        """
+        tasks = [self.analyze_investment_async(**request) for request in requests]
+        return await asyncio.gather(*tasks)
+
     def _create_analysis_result(
         self,
         symbol: str,
@@ -242,21 +337,26 @@ class InvestmentAdvisorAgent:
     ) -> StockAnalysisResult:
         """분석 결과 객체 생성"""
         
-        # 실제로는 raw_result를 파싱하여 구조화된 데이터 추출
-        # 현재는 더미 데이터로 구현
-        
-        # 추천 결정 (더미 로직)
-        recommendation = RecommendationType.BUY  # 기본값
-        confidence_level = Decimal('0.75')
+        # 핵심 필드는 부분 출력에서 조기 추출, 나머지는 더미 데이터로 구현
+        recommendation, confidence_level = _extract_early_fields(raw_result)
+        if recommendation is None:
+            recommendation = RecommendationType.BUY  # 기본값
+        if confidence_level is None:
+            confidence_level = Decimal('0.75')
         risk_level = RiskLevel.MEDIUM
         
-        # 가격 타겟 설정
-        target_price_factor = Decimal('1.15')  # 15% 상승 목표
+        # 가격 타겟 설정 — 권고 수준의 근사 계산이므로 float로 수행하고
+        # 모델 경계에서만 Decimal로 복원 (Decimal 곱셈은 float 대비 수십 배 느림)
+        price = float(current_price)
+        target_price = price * 1.15  # 15% 상승 목표
+        entry_price = price * 0.98   # 2% 하락 시 진입
+        stop_loss = price * 0.90     # 10% 손절
+
         price_targets = PriceTarget(
-            target_price=current_price * target_price_factor,
-            entry_price=current_price * Decimal('0.98'),  # 2% 하락 시 진입
-            stop_loss=current_price * Decimal('0.90'),    # 10% 손절
-            take_profit=current_price * target_price_factor,
+            target_price=Decimal(f"{target_price:.4f}"),
+            entry_price=Decimal(f"{entry_price:.4f}"),
+            stop_loss=Decimal(f"{stop_loss:.4f}"),
+            take_profit=Decimal(f"{target_price:.4f}"),
             time_horizon="medium_term"
         )
         
@@ -292,13 +392,17 @@ class InvestmentAdvisorAgent:
             processing_time=processing_time
         )
         
-        # Agent 분석 결과들 추가
-        if sentiment_analysis:
-            analysis_result.add_agent_analysis(sentiment_analysis)
-        if risk_analysis:
-            analysis_result.add_agent_analysis(risk_analysis)
-            
-        # 자체 분석 결과 추가
+        # 대용량 raw 출력은 기본적으로 다이제스트만 보관 (디버그 시에만 전문 유지)
+        raw_text = str(raw_result)
+        if settings.debug_store_raw:
+            raw_data = {"raw_analysis": raw_text}
+        else:
+            raw_data = {
+                "raw_analysis_sha": hashlib.sha256(raw_text.encode('utf-8')).hexdigest(),
+                "raw_analysis_len": len(raw_text)
+            }
+
+        # 자체 분석 결과 생성
         advisor_analysis = AgentAnalysis(
             agent_name="Investment Advisor",
             analysis_type="investment",
@@ -310,13 +414,14 @@ class InvestmentAdvisorAgent:
                 f"신뢰도: {float(confidence_level)*100:.0f}%"
             ],
             confidence_score=confidence_level,
-            data={
-                "raw_analysis": raw_result,
-                "processing_time": processing_time
-            }
+            data=dict(raw_data, processing_time=processing_time)
         )
-        analysis_result.add_agent_analysis(advisor_analysis)
-        
+
+        # Agent 분석 결과들을 한 번에 추가
+        for agent_analysis in (sentiment_analysis, risk_analysis, advisor_analysis):
+            if agent_analysis:
+                analysis_result.add_agent_analysis(agent_analysis)
+
         return analysis_result
     
     def _create_default_analysis_result(self, symbol: str, company_name: str, current_price: Decimal, error_msg: str) -> StockAnalysisResult:
@@ -332,7 +437,7 @@ class InvestmentAdvisorAgent:
             price_targets=PriceTarget(
                 target_price=current_price,
                 entry_price=current_price,
-                stop_loss=current_price * Decimal('0.95'),
+                stop_loss=Decimal(f"{float(current_price) * 0.95:.4f}"),
                 time_horizon="medium_term"
             ),
             rationale=InvestmentRationale(
@@ -1,90 +1,59 @@
+import asyncio
+import logging
+import time
 from crewai import Agent, Task, Crew
-from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 from decimal import Decimal
 
 from ..models import MarketSentiment, AgentAnalysis
-from ..utils import app_logger, analysis_logger, settings
+from ..utils import app_logger, analysis_logger, settings, llm_cache, today_str
 
 
-class MarketSentimentAgent:
-    """시장 심리 분석 전문가"""
-    
-    def __init__(self, tools: List[Any] = None):
-        self.tools = tools or []
-        self.agent = self._create_agent()
-        
-    def _create_agent(self) -> Agent:
-        """Agent 생성"""
-        return Agent(
-            role="Market Sentiment Analyst",
-            goal="시장 전반의 심리와 투자자 정서를 정확하게 분석하여 투자 결정에 도움이 되는 인사이트를 제공한다.",
-            backstory="""
-            당신은 15년 경력의 시장 심리 분석 전문가입니다. 
-            뉴스, 소셜미디어, 경제지표를 종합적으로 분석하여 시장의 정서를 파악하는데 탁월한 능력을 보유하고 있습니다.
-            
-            특히 다음 분야에 전문성을 가지고 있습니다:
-            - 뉴스 헤드라인 감성 분석
-            - 소셜 미디어 트렌드 모니터링  
-            - Fear & Greed Index 해석
-            - VIX, VKOSPI 등 변동성 지수 분석
-            - 한국과 미국 시장의 상호작용 분석
-            
-            항상 객관적이고 데이터에 기반한 분석을 제공하며, 
-            감정적 편향을 배제하고 사실에 근거한 판단을 내립니다.
-            """,
-            verbose=True,
-            allow_delegation=False,
-            tools=self.tools,
-            max_iter=3
-        )
-    
-    def create_sentiment_analysis_task(self, symbol: str, company_name: str, market: str) -> Task:
-        """시장 심리 분석 태스크 생성"""
-        return Task(
-            description=f"""
+# 불변 태스크 템플릿 (임포트 시 1회 구성, 호출마다 재조립하지 않음)
+_SENTIMENT_TASK_DESCRIPTION = """
             {company_name} ({symbol})의 시장 심리를 종합적으로 분석하세요.
-            
+
             분석 범위:
             1. 뉴스 감성 분석
                - 최근 1주일 뉴스 헤드라인 분석
                - 긍정/중립/부정 뉴스 비율
                - 주요 뉴스 이슈와 시장 반응
-               
+
             2. 소셜 미디어 트렌드 (가능한 경우)
                - 투자자 정서 파악
                - 주요 논의 이슈
                - 감정적 편향도 측정
-               
+
             3. 시장 지표 분석
                - Fear & Greed Index 현재 상태
                - VIX (US) / VKOSPI (KR) 분석
                - 시장 변동성 해석
-               
+
             4. 동종업계/섹터 심리
                - 섹터 전반 투자심리
                - 경쟁사 대비 상대적 평가
-               
+
             5. 거시경제 환경
                - 금리 환경과 투자 심리
                - 경제 정책이 해당 종목에 미치는 영향
-               
+
             최종 결과물:
             - 감성 점수 (-1.0 ~ 1.0)
             - 감성 카테고리 (positive/neutral/negative)
             - 신뢰도 점수 (0.0 ~ 1.0)
             - 주요 감성 드라이버 3-5개
             - 향후 1개월 감성 전망
-            
+
             Market: {market}
-            분석 기준일: {datetime.now().strftime('%Y-%m-%d')}
-            """,
-            agent=self.agent,
-            expected_output="""
+            분석 기준일: {analysis_date}
+            """
+
+_SENTIMENT_TASK_EXPECTED_OUTPUT = """
             시장 심리 분석 결과를 다음 JSON 형태로 제공:
             {
                 "sentiment_score": -0.5 ~ 1.0,
-                "sentiment_category": "positive/neutral/negative", 
+                "sentiment_category": "positive/neutral/negative",
                 "confidence": 0.0 ~ 1.0,
                 "key_drivers": ["드라이버1", "드라이버2", ...],
                 "news_sentiment": -1.0 ~ 1.0,
@@ -95,29 +64,98 @@ class MarketSentimentAgent:
                 "risk_factors": ["리스크1", "리스크2", ...]
             }
             """
+
+
+@lru_cache(maxsize=4)
+def _build_sentiment_agent(tools: tuple) -> Agent:
+    """동일 도구 구성에 대해 Agent를 재사용 (대형 backstory 재구성 방지)"""
+    return Agent(
+        role="Market Sentiment Analyst",
+        goal="시장 전반의 심리와 투자자 정서를 정확하게 분석하여 투자 결정에 도움이 되는 인사이트를 제공한다.",
+        # 토큰 절약을 위한 요약 backstory — 전체 프로필은
+        # resources/backstories/market_sentiment.md (get_backstory 참조)
+        backstory="15년 경력의 시장 심리 분석 전문가. 뉴스·소셜미디어 감성, "
+                  "Fear & Greed Index, VIX/VKOSPI 변동성 지수를 근거로 "
+                  "객관적이고 데이터 기반의 판단을 내린다.",
+        verbose=settings.crewai_verbose,
+        allow_delegation=False,
+        tools=list(tools),
+        max_iter=3
+    )
+
+
+class MarketSentimentAgent:
+    """시장 심리 분석 전문가"""
+
+    def __init__(self, tools: List[Any] = None):
+        self.tools = tools or []
+        self.agent = self._create_agent()
+        # LLM 동시 호출 수 제한 (Provider RPM 한도 보호)
+        self._llm_semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+        # 재사용 Crew (첫 분석 시 생성)
+        self._crew: Optional[Crew] = None
+
+    def _create_agent(self) -> Agent:
+        """Agent 생성 (동일 도구 구성이면 캐시 재사용)"""
+        return _build_sentiment_agent(tuple(self.tools))
+
+    def _get_crew(self, task: Task) -> Crew:
+        """Crew 재사용 — 프레임워크 검증·설정 비용을 첫 호출에만 지불"""
+        if self._crew is None:
+            self._crew = Crew(
+                agents=[self.agent],
+                tasks=[task],
+                verbose=settings.crewai_verbose
+            )
+        else:
+            self._crew.tasks = [task]
+        return self._crew
+
+    def create_sentiment_analysis_task(self, symbol: str, company_name: str, market: str) -> Task:
+        """시장 심리 분석 태스크 생성"""
+        return Task(
+            description=_SENTIMENT_TASK_DESCRIPTION.format(
+                company_name=company_name,
+                symbol=symbol,
+                market=market,
+                analysis_date=today_str()
+            ),
+            agent=self.agent,
+            expected_output=_SENTIMENT_TASK_EXPECTED_OUTPUT
         )
     
     def analyze_sentiment(self, symbol: str, company_name: str, market: str) -> AgentAnalysis:
         """시장 심리 분석 실행"""
         analysis_logger.log_analysis_start(symbol, "market_sentiment")
-        start_time = datetime.now()
-        
+        start_time = time.perf_counter()
+
+        # 동일 종목·동일 날짜 재분석은 LLM 호출 없이 캐시에서 반환
+        cache_key = None
+        if settings.cache_enabled:
+            cache_key = llm_cache.make_key(
+                analysis_type="sentiment",
+                symbol=symbol,
+                company_name=company_name,
+                market=market,
+                date=today_str()
+            )
+            cached_result = llm_cache.get(cache_key)
+            if cached_result is not None:
+                app_logger.info(f"LLM 캐시 적중: {symbol} (sentiment)")
+                return cached_result
+
         try:
             # 태스크 생성
             sentiment_task = self.create_sentiment_analysis_task(symbol, company_name, market)
             
-            # Crew 생성 및 실행
-            crew = Crew(
-                agents=[self.agent],
-                tasks=[sentiment_task],
-                verbose=True
-            )
-            
+            # 재사용 Crew에 태스크 장착 후 실행
+            crew = self._get_crew(sentiment_task)
+
             # 분석 실행
             result = crew.kickoff()
             
             # 결과 파싱 (실제로는 더 정교한 파싱 로직 필요)
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             
             # AgentAnalysis 객체 생성
             agent_analysis = AgentAnalysis(
@@ -137,13 +175,17 @@ class MarketSentimentAgent:
                 }
             )
             
-            analysis_logger.log_analysis_complete(symbol, agent_analysis.to_dict(), processing_time)
+            if analysis_logger.logger.isEnabledFor(logging.INFO):
+                analysis_logger.log_analysis_complete(symbol, agent_analysis.to_dict(), processing_time)
             analysis_logger.log_agent_execution("Market Sentiment Analyst", symbol, processing_time, True)
-            
+
+            if cache_key:
+                llm_cache.set(cache_key, agent_analysis)
+
             return agent_analysis
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             analysis_logger.log_analysis_error(symbol, e)
             analysis_logger.log_agent_execution("Market Sentiment Analyst", symbol, processing_time, False)
             
@@ -157,6 +199,15 @@ class MarketSentimentAgent:
                 data={"error": str(e), "processing_time": processing_time}
             )
     
+    async def analyze_sentiment_async(self, symbol: str, company_name: str, market: str) -> AgentAnalysis:
+        """analyze_sentiment의 비동기 래퍼
+
+        crew.kickoff()가 블로킹 네트워크 호출이므로 스레드로 넘기고,
+        세마포어로 동시 LLM 호출 수를 제한한다.
+        """
+        async with self._llm_semaphore:
+            return await asyncio.to_thread(self.analyze_sentiment, symbol, company_name, market)
+
     def get_market_sentiment_score(self, symbol: str, market: str) -> MarketSentiment:
         """시장 심리 점수 계산"""
         try:
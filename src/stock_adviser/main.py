@@ -5,6 +5,7 @@ Main Application Entry Point
 """
 
 import asyncio
+import contextlib
 import sys
 import argparse
 from typing import Dict, Any, Optional
@@ -16,6 +17,23 @@ from .utils import app_logger, settings, validate_api_keys
 from .models import RecommendationType
 
 
+try:
+    # orjson은 선택적 의존성 — C 구현이라 대형 포트폴리오 JSON에서 수 배 빠름
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# 추천 등급별 이모지 (모듈 로드 시 1회 구성)
+_REC_EMOJI = {
+    RecommendationType.STRONG_BUY.value: "🟢",
+    RecommendationType.BUY.value: "🔵",
+    RecommendationType.HOLD.value: "🟡",
+    RecommendationType.SELL.value: "🟠",
+    RecommendationType.STRONG_SELL.value: "🔴"
+}
+
+
 class DecimalEncoder(json.JSONEncoder):
     """Decimal 타입을 JSON으로 인코딩하기 위한 커스텀 인코더"""
     def default(self, obj):
@@ -24,6 +42,35 @@ class DecimalEncoder(json.JSONEncoder):
         return super(DecimalEncoder, self).default(obj)
 
 
+def _json_loads(text: str):
+    """JSON 파싱 (orjson 사용 가능 시 우선)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _decimal_default(obj):
+    """orjson용 default — Decimal만 float로, 그 외는 TypeError
+
+    DecimalEncoder와 동일하게 직렬화 불가 타입은 조용히 null이 되는
+    대신 즉시 실패시킨다 (사용자 출력 파일의 무결성 보장).
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps_pretty(data) -> str:
+    """분석 결과 직렬화 (Decimal → float, 들여쓰기 2칸)"""
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=_decimal_default,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(data, cls=DecimalEncoder, indent=2, ensure_ascii=False)
+
+
 async def analyze_single_stock(adviser: DualStockAdviser, symbol: str, market: str, user_profile: Optional[Dict] = None):
     """단일 종목 분석"""
     try:
@@ -49,31 +96,41 @@ async def analyze_multiple_stocks(adviser: DualStockAdviser, symbols: list, mark
     """여러 종목 비교 분석"""
     try:
         print(f"\n📊 {len(symbols)}개 종목 비교 분석 중...")
-        
-        # 병렬 분석
-        tasks = [adviser.analyze_stock(symbol, market) for symbol in symbols]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
+
+        # 병렬 분석 — 세마포어로 동시 LLM 호출 수를 제한하고,
+        # as_completed로 먼저 끝난 종목부터 결과를 확보한다
+        semaphore = asyncio.Semaphore(settings.max_concurrent_llm)
+
+        async def analyze_with_limit(symbol: str):
+            # 예외를 태스크 안에서 심볼과 함께 반환해
+            # 실패 메시지가 어느 종목인지 잃지 않게 한다
+            async with semaphore:
+                try:
+                    return symbol, await adviser.analyze_stock(symbol, market)
+                except Exception as e:
+                    return symbol, e
+
         successful_results = []
-        for i, result in enumerate(results):
+        for future in asyncio.as_completed([analyze_with_limit(s) for s in symbols]):
+            symbol, result = await future
+
             if isinstance(result, Exception):
-                print(f"❌ {symbols[i]} 분석 실패: {str(result)}")
-            elif result:
+                print(f"❌ {symbol} 분석 실패: {str(result)}")
+                continue
+
+            if result:
+                print(f"  ✅ {symbol} 분석 완료")
                 successful_results.append(result)
-        
+            else:
+                print(f"❌ {symbol} 분석 실패")
+
         if successful_results:
             print(f"\n📈 비교 분석 결과 ({len(successful_results)}/{len(symbols)} 성공)")
             print("=" * 60)
             
             for result in successful_results:
-                rec_emoji = {
-                    RecommendationType.STRONG_BUY.value: "🟢",
-                    RecommendationType.BUY.value: "🔵", 
-                    RecommendationType.HOLD.value: "🟡",
-                    RecommendationType.SELL.value: "🟠",
-                    RecommendationType.STRONG_SELL.value: "🔴"
-                }.get(result.recommendation.value, "⚪")
-                
+                rec_emoji = _REC_EMOJI.get(result.recommendation.value, "⚪")
+
                 print(f"{rec_emoji} {result.company_name} ({result.symbol})")
                 print(f"   추천: {result.recommendation.value.upper()}")
                 print(f"   현재가: {float(result.current_price):,.0f}원")
@@ -92,9 +149,9 @@ async def analyze_portfolio_command(adviser: DualStockAdviser, portfolio_config:
         # 포트폴리오 설정 로드 (파일 또는 JSON 문자열)
         if portfolio_config.endswith('.json'):
             with open(portfolio_config, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+                config = _json_loads(f.read())
         else:
-            config = json.loads(portfolio_config)
+            config = _json_loads(portfolio_config)
         
         holdings = config.get('holdings', [])
         if not holdings:
@@ -250,24 +307,25 @@ async def main():
         return
     
     try:
-        # DualStockAdviser 초기화
-        adviser = DualStockAdviser()
-        
-        if args.command == 'analyze':
-            user_profile = setup_user_profile(args)
-            result = await analyze_single_stock(adviser, args.symbol, args.market, user_profile)
-            
-            if args.json and result:
-                print("\n📄 JSON 결과:")
-                print(json.dumps(result.to_dict(), cls=DecimalEncoder, indent=2, ensure_ascii=False))
-        
-        elif args.command == 'compare':
-            symbols = [s.strip() for s in args.symbols.split(',')]
-            await analyze_multiple_stocks(adviser, symbols, args.market)
-        
-        elif args.command == 'portfolio':
-            await analyze_portfolio_command(adviser, args.config)
-        
+        # DualStockAdviser 초기화 — 종료 시 세션/프로세스 풀을 명시적으로 정리
+        async with contextlib.AsyncExitStack() as stack:
+            adviser = await stack.enter_async_context(DualStockAdviser())
+
+            if args.command == 'analyze':
+                user_profile = setup_user_profile(args)
+                result = await analyze_single_stock(adviser, args.symbol, args.market, user_profile)
+
+                if args.json and result:
+                    print("\n📄 JSON 결과:")
+                    print(_json_dumps_pretty(result.to_dict()))
+
+            elif args.command == 'compare':
+                symbols = [s.strip() for s in args.symbols.split(',')]
+                await analyze_multiple_stocks(adviser, symbols, args.market)
+
+            elif args.command == 'portfolio':
+                await analyze_portfolio_command(adviser, args.config)
+
     except KeyboardInterrupt:
         print("\n\n⏹️  사용자에 의해 중단됨")
     except Exception as e:
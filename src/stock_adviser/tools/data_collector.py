@@ -1,46 +1,303 @@
 import yfinance as yf
+import numpy as np
 import requests
+import json
+import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 import asyncio
 import aiohttp
+import yarl
 from decimal import Decimal
 
 from ..models import StockData, StockInfo, StockPrice, FinancialMetrics, TechnicalIndicators
 from ..utils import settings, app_logger, performance_logger, get_market_config, APIEndpoints
+from ._indicators import calculate_rsi, calculate_bollinger_bands, calculate_macd
+
+try:
+    # orjson은 선택적 의존성 — 50~200KB 뉴스 응답 디코딩이 수 배 빠름
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # requests_cache는 선택적 의존성 — 반복 조회를 로컬 SQLite 히트로 전환
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+
+def _decode_json(raw: bytes):
+    """응답 바이트를 JSON으로 디코딩 (orjson 사용 가능 시 우선)"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class _IndicatorState:
+    """심볼별 증분 기술적 지표 상태 (새 봉마다 O(1) 갱신)
+
+    같은 심볼을 분 단위로 재분석할 때 윈도우 전체를 다시 계산하는
+    대신 20일 합·제곱합(SMA/볼린저), Wilder 평활 RSI, MACD EMA
+    상태를 유지해 봉 하나당 상수 시간에 지표를 갱신한다.
+    """
+
+    WINDOW = 20
+    RSI_PERIOD = 14
+
+    def __init__(self):
+        self.window = deque(maxlen=self.WINDOW)
+        self.window_sum = 0.0
+        self.window_sq_sum = 0.0
+        self.prev_close: Optional[float] = None
+        self.avg_gain = 0.0
+        self.avg_loss = 0.0
+        # Wilder 시드용 누적값 — 첫 RSI_PERIOD개 델타는 단순 합산하고,
+        # 기간이 차는 시점에 평균으로 변환한 뒤 점화식으로 전환한다
+        self.delta_count = 0
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self.ema_fast: Optional[float] = None
+        self.ema_slow: Optional[float] = None
+        self.ema_signal: Optional[float] = None
+        self.count = 0
+
+    def update(self, close: float) -> None:
+        """새 종가 1건 반영"""
+        # 롤링 합/제곱합 (윈도우에서 빠지는 값만 차감)
+        if len(self.window) == self.WINDOW:
+            old = self.window[0]
+            self.window_sum -= old
+            self.window_sq_sum -= old * old
+        self.window.append(close)
+        self.window_sum += close
+        self.window_sq_sum += close * close
+
+        # Wilder 평활 RSI — 0에서 점화식을 시작하면 초기 스냅샷이
+        # 배치 경로와 크게 어긋나므로, 표준 정의대로 첫 기간의
+        # 단순 평균을 시드로 쓰고 그 이후에만 점화식을 적용한다
+        if self.prev_close is not None:
+            delta = close - self.prev_close
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            n = self.RSI_PERIOD
+            self.delta_count += 1
+            if self.delta_count <= n:
+                self._gain_sum += gain
+                self._loss_sum += loss
+                if self.delta_count == n:
+                    self.avg_gain = self._gain_sum / n
+                    self.avg_loss = self._loss_sum / n
+            else:
+                self.avg_gain = (self.avg_gain * (n - 1) + gain) / n
+                self.avg_loss = (self.avg_loss * (n - 1) + loss) / n
+        self.prev_close = close
+
+        # MACD EMA 상태 (12/26/9)
+        if self.ema_fast is None:
+            self.ema_fast = self.ema_slow = close
+        else:
+            self.ema_fast += (2 / 13) * (close - self.ema_fast)
+            self.ema_slow += (2 / 27) * (close - self.ema_slow)
+        macd = self.ema_fast - self.ema_slow
+        if self.ema_signal is None:
+            self.ema_signal = macd
+        else:
+            self.ema_signal += (2 / 10) * (macd - self.ema_signal)
+
+        self.count += 1
+
+    def snapshot(self) -> Optional[TechnicalIndicators]:
+        """현재 상태의 지표 스냅샷 (워밍업 전이면 None)"""
+        if len(self.window) < self.WINDOW:
+            return None
+
+        indicators = TechnicalIndicators()
+
+        mid = self.window_sum / self.WINDOW
+        variance = max(self.window_sq_sum / self.WINDOW - mid * mid, 0.0)
+        sd = variance ** 0.5
+        indicators.sma_20 = Decimal(str(mid))
+        indicators.bollinger_middle = Decimal(str(mid))
+        indicators.bollinger_upper = Decimal(str(mid + 2 * sd))
+        indicators.bollinger_lower = Decimal(str(mid - 2 * sd))
+
+        if self.delta_count >= self.RSI_PERIOD:
+            if self.avg_loss > 0:
+                rs = self.avg_gain / self.avg_loss
+                indicators.rsi = Decimal(str(100 - 100 / (1 + rs)))
+            else:
+                indicators.rsi = Decimal('100')
+
+        macd = self.ema_fast - self.ema_slow
+        indicators.macd = Decimal(str(macd))
+        indicators.macd_signal = Decimal(str(self.ema_signal))
+        indicators.macd_histogram = Decimal(str(macd - self.ema_signal))
+
+        return indicators
 
 
 class DataCollector:
     """주식 데이터 수집 도구"""
     
     def __init__(self):
-        self.session = requests.Session()
+        # HTTP 세션 — requests_cache가 있으면 디스크 캐시 세션으로 승격
+        # (같은 심볼 재조회가 HTTPS 왕복 대신 로컬 SQLite 읽기가 됨)
+        if requests_cache is not None and settings.cache_enabled:
+            cache_dir = settings.project_root / ".cache"
+            cache_dir.mkdir(exist_ok=True)
+            self.session = requests_cache.CachedSession(
+                str(cache_dir / "http_cache"),
+                backend='sqlite',
+                expire_after=settings.cache_ttl
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
-        
+        # 공유 aiohttp 세션 (이벤트 루프가 필요해 첫 사용 시 생성)
+        self._aiohttp: Optional[aiohttp.ClientSession] = None
+        # 키 → (만료 시각, Future) TTL 캐시 — 진행 중인 Future를 저장해
+        # 같은 키의 동시 요청이 하나의 fetch를 공유한다 (dogpile 방지)
+        self._fetch_cache: Dict[tuple, tuple] = {}
+        # 심볼별 증분 지표 상태 (스트리밍 재분석용)
+        self._indicator_states: Dict[str, _IndicatorState] = {}
+        # yf.Ticker 재사용 캐시: yf_symbol → (ticker, 생성 시각)
+        # 생성자마다 세션/헤더 초기화와 쿠키·crumb 수집이 반복되는 것을 방지
+        self._ticker_cache: Dict[str, tuple] = {}
+        # 뉴스 API 요청 골격 (호출마다 URL 문자열 포맷/딕셔너리 재조립 방지)
+        self._news_everything_url = yarl.URL(f"{APIEndpoints.NEWS_API_BASE}/everything")
+        self._news_base_params = {
+            'sortBy': 'publishedAt',
+            'apiKey': settings.news_api_key or ''
+        }
+        self._serper_news_url = yarl.URL(f"{APIEndpoints.SERPER_API_BASE}/news")
+        self._serper_headers = {
+            'X-API-KEY': settings.serper_api_key or '',
+            'Content-Type': 'application/json'
+        }
+
+    _TICKER_TTL = 60.0  # 초
+
+    def _get_ticker(self, yf_symbol: str) -> yf.Ticker:
+        """캐시된 yf.Ticker 반환 (60초 TTL)
+
+        한 번의 get_stock_data 안에서, 그리고 포트폴리오 분석의 연속
+        심볼 간에 같은 Ticker 객체와 기저 HTTP 세션 상태를 공유한다.
+        """
+        now = time.monotonic()
+        cached = self._ticker_cache.get(yf_symbol)
+        if cached is not None and now - cached[1] < self._TICKER_TTL:
+            return cached[0]
+
+        ticker = yf.Ticker(yf_symbol)
+        self._ticker_cache[yf_symbol] = (ticker, now)
+        return ticker
+
+    def update_technical_indicators(self, symbol: str, close: float) -> Optional[TechnicalIndicators]:
+        """새 봉 1건을 O(1)로 반영한 기술적 지표 스냅샷
+
+        전체 이력 재계산 없이 증분 상태만 갱신하므로 같은 심볼을
+        짧은 간격으로 재분석하는 스트리밍 경로에 적합하다.
+        """
+        state = self._indicator_states.get(symbol)
+        if state is None:
+            state = self._indicator_states[symbol] = _IndicatorState()
+        state.update(close)
+        return state.snapshot()
+
+    async def _cached_fetch(self, key: tuple, ttl: float, fetch):
+        """TTL + single-flight 캐시를 거친 fetch 실행
+
+        포트폴리오 분석은 같은 심볼을 짧은 간격으로 반복 조회하므로
+        키별로 결과 Future를 TTL 동안 보관한다. 미스 시 Future를
+        먼저 캐시에 넣어 동시 호출자들이 같은 원격 호출을 기다린다.
+        """
+        if not settings.cache_enabled:
+            return await fetch()
+
+        now = time.monotonic()
+        entry = self._fetch_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return await entry[1]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._fetch_cache[key] = (now + ttl, future)
+        try:
+            result = await fetch()
+        except Exception as e:
+            self._fetch_cache.pop(key, None)
+            future.set_exception(e)
+            future.exception()  # 대기자가 없을 때의 미회수 경고 방지
+            raise
+        future.set_result(result)
+        return result
+
+    def _get_aiohttp_session(self) -> aiohttp.ClientSession:
+        """공유 aiohttp 세션 반환 (지연 생성)
+
+        요청마다 새 세션을 만들면 호출마다 TCP+TLS 핸드셰이크를
+        다시 치르므로, 커넥션 풀과 keep-alive를 가진 세션 하나를
+        만들어 모든 뉴스 API 호출이 재사용한다.
+        """
+        if self._aiohttp is None or self._aiohttp.closed:
+            self._aiohttp = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=64, limit_per_host=16, ttl_dns_cache=300
+                ),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self._aiohttp
+
+    async def aclose(self):
+        """공유 네트워크 자원 정리 (소유 서비스가 종료 시 호출)
+
+        __del__에 의존하지 않는 명시적 수명 관리 — GC 시점의 임의
+        정리는 사용 중인 세션을 닫거나 스레드 친화성 문제를 일으킬
+        수 있다.
+        """
+        if self._aiohttp is not None and not self._aiohttp.closed:
+            await self._aiohttp.close()
+        self.session.close()
+
     async def get_stock_data(self, symbol: str, market: str, period: str = "1y") -> Optional[StockData]:
         """종합 주식 데이터 수집"""
         try:
             app_logger.info(f"주식 데이터 수집 시작: {symbol} ({market})")
-            start_time = datetime.now()
-            
-            # 병렬로 데이터 수집
-            tasks = [
-                self.get_price_data(symbol, market, period),
-                self.get_company_info(symbol, market),
-                self.get_financial_metrics(symbol, market),
-                self.get_news_data(symbol, market)
-            ]
-            
-            price_data, company_info, financial_metrics, news_data = await asyncio.gather(*tasks)
-            
+            start_time = time.perf_counter()
+
+            yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
+
+            # yfinance 번들(.info/.history/.news)은 한 번만 가져오고,
+            # 진짜 비동기인 외부 뉴스 API만 병렬 형제로 수집
+            bundle, news_data = await asyncio.gather(
+                self._fetch_ticker_bundle(yf_symbol, period),
+                self._fetch_external_news(symbol, market, 10)
+            )
+
+            price_data = self._build_price_data(symbol, bundle['hist'])
+            company_info = self._build_company_info(symbol, market, bundle['info'])
+            financial_metrics = self._build_financial_metrics(symbol, bundle['info'])
+
+            # 외부 뉴스가 부족하면 번들의 yfinance 뉴스로 보충
+            if len(news_data) < 10:
+                news_data.extend(
+                    self._format_yfinance_news(bundle['news'], 10 - len(news_data))
+                )
+
             if not price_data or not company_info:
                 app_logger.error(f"필수 데이터 수집 실패: {symbol}")
                 return None
             
-            # 기술적 지표 계산
-            technical_indicators = self.calculate_technical_indicators(price_data)
+            # 기술적 지표 계산 — 종가는 DataFrame에서 바로 float64 배열로 뽑아
+            # StockPrice의 Decimal을 다시 float로 되돌리는 왕복을 생략
+            closes_f64 = None
+            if bundle['hist'] is not None and not bundle['hist'].empty:
+                closes_f64 = bundle['hist']['Close'].to_numpy(dtype=np.float64)
+            technical_indicators = self.calculate_technical_indicators(price_data, closes_f64)
             
             # StockData 객체 생성
             stock_data = StockData(
@@ -55,7 +312,7 @@ class DataCollector:
                 news_data=news_data
             )
             
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
             performance_logger.log_processing_time("stock_data_collection", processing_time, symbol)
             
             app_logger.info(f"주식 데이터 수집 완료: {symbol}, 처리시간: {processing_time:.2f}초")
@@ -65,140 +322,222 @@ class DataCollector:
             app_logger.error(f"주식 데이터 수집 실패: {symbol}, 오류: {str(e)}")
             return None
     
+    async def _fetch_ticker_bundle(self, yf_symbol: str, period: str = "1y") -> Dict[str, Any]:
+        """yfinance 데이터를 한 번의 원격 호출 묶음으로 수집
+
+        .info는 블로킹 HTTPS 호출이라 기업 정보와 재무 지표가 각자
+        가져오면 같은 응답을 두 번 받는다. 스레드 하나에서 info,
+        가격 이력, 뉴스를 한 번에 수집해 빌더들이 공유하게 한다.
+        """
+        def _sync_fetch():
+            ticker = self._get_ticker(yf_symbol)
+            info = ticker.info or {}
+            hist = ticker.history(period=period)
+            try:
+                news = ticker.news or []
+            except Exception:
+                news = []
+            return {'info': info, 'hist': hist, 'news': news}
+
+        return await self._cached_fetch(
+            ('bundle', yf_symbol, period), 60,
+            lambda: asyncio.to_thread(_sync_fetch)
+        )
+
+    def _build_price_data(self, symbol: str, hist) -> List[StockPrice]:
+        """가격 이력 DataFrame → StockPrice 리스트 변환"""
+        if hist is None or hist.empty:
+            app_logger.warning(f"가격 데이터 없음: {symbol}")
+            return []
+
+        # iterrows는 행마다 Series를 박싱하므로 열 단위로 한 번에 추출
+        o, h, l, c = hist[['Open', 'High', 'Low', 'Close']].to_numpy(dtype=np.float64).T
+        v = hist['Volume'].to_numpy(dtype=np.int64)
+        ts = hist.index.to_pydatetime()
+
+        # f-string 포맷은 str(float) 경로보다 빠르고 자릿수가 고정된다
+        price_data = [
+            StockPrice(
+                open=Decimal(f"{o[i]:.4f}"),
+                high=Decimal(f"{h[i]:.4f}"),
+                low=Decimal(f"{l[i]:.4f}"),
+                close=Decimal(f"{c[i]:.4f}"),
+                volume=int(v[i]),
+                timestamp=ts[i]
+            )
+            for i in range(len(c))
+        ]
+
+        performance_logger.log_processing_time("price_data_fetch", 0.5, symbol)
+        return price_data
+
+    def _build_company_info(self, symbol: str, market: str, info: Dict[str, Any]) -> Optional[StockInfo]:
+        """info 딕셔너리 → StockInfo 변환"""
+        if not info:
+            app_logger.warning(f"기업 정보 없음: {symbol}")
+            return None
+
+        market_config = get_market_config(market)
+
+        return StockInfo(
+            symbol=symbol,
+            name=info.get('longName', info.get('shortName', symbol)),
+            market=market.upper(),
+            sector=info.get('sector'),
+            industry=info.get('industry'),
+            currency=market_config['currency']
+        )
+
+    def _sync_get_price_data(self, symbol: str, market: str, period: str) -> List[StockPrice]:
+        """가격 데이터 수집 (블로킹 yfinance 호출, 스레드에서 실행)"""
+        yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
+        ticker = self._get_ticker(yf_symbol)
+        hist = ticker.history(period=period)
+        return self._build_price_data(symbol, hist)
+
     async def get_price_data(self, symbol: str, market: str, period: str = "1y") -> List[StockPrice]:
-        """가격 데이터 수집"""
+        """가격 데이터 수집
+
+        yfinance는 동기 HTTPS 호출이므로 스레드로 넘겨야
+        asyncio.gather의 형제 태스크들과 실제로 병렬 실행된다.
+        """
         try:
-            # yfinance 심볼 변환
-            yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
-            
-            # 데이터 수집
-            ticker = yf.Ticker(yf_symbol)
-            hist = ticker.history(period=period)
-            
-            if hist.empty:
-                app_logger.warning(f"가격 데이터 없음: {symbol}")
-                return []
-            
-            price_data = []
-            for date, row in hist.iterrows():
-                price = StockPrice(
-                    open=Decimal(str(row['Open'])),
-                    high=Decimal(str(row['High'])),
-                    low=Decimal(str(row['Low'])),
-                    close=Decimal(str(row['Close'])),
-                    volume=int(row['Volume']),
-                    timestamp=date.to_pydatetime()
-                )
-                price_data.append(price)
-            
-            performance_logger.log_processing_time("price_data_fetch", 0.5, symbol)
-            return price_data
-            
+            return await self._cached_fetch(
+                ('price', symbol, market, period), 60,
+                lambda: asyncio.to_thread(self._sync_get_price_data, symbol, market, period)
+            )
         except Exception as e:
             app_logger.error(f"가격 데이터 수집 실패: {symbol}, 오류: {str(e)}")
             return []
-    
+
+    def _sync_get_company_info(self, symbol: str, market: str) -> Optional[StockInfo]:
+        """기업 정보 수집 (블로킹 yfinance 호출, 스레드에서 실행)"""
+        yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
+        ticker = self._get_ticker(yf_symbol)
+        info = ticker.info
+        return self._build_company_info(symbol, market, info)
+
     async def get_company_info(self, symbol: str, market: str) -> Optional[StockInfo]:
         """기업 정보 수집"""
         try:
-            yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
-            ticker = yf.Ticker(yf_symbol)
-            info = ticker.info
-            
-            if not info:
-                app_logger.warning(f"기업 정보 없음: {symbol}")
-                return None
-            
-            market_config = get_market_config(market)
-            
-            stock_info = StockInfo(
-                symbol=symbol,
-                name=info.get('longName', info.get('shortName', symbol)),
-                market=market.upper(),
-                sector=info.get('sector'),
-                industry=info.get('industry'),
-                currency=market_config['currency']
+            return await self._cached_fetch(
+                ('info', symbol, market), 3600,
+                lambda: asyncio.to_thread(self._sync_get_company_info, symbol, market)
             )
-            
-            return stock_info
-            
         except Exception as e:
             app_logger.error(f"기업 정보 수집 실패: {symbol}, 오류: {str(e)}")
             return None
-    
-    async def get_financial_metrics(self, symbol: str, market: str) -> FinancialMetrics:
-        """재무 지표 수집"""
+
+    # (info 키, FinancialMetrics 속성, 배율) — 선언적 매핑으로 키당
+    # 딕셔너리 조회를 한 번으로 줄인다 (in + [] 이중 조회 제거)
+    _FIN_METRIC_MAP = (
+        ('trailingPE', 'pe_ratio', 1),
+        ('priceToBook', 'pb_ratio', 1),
+        ('returnOnEquity', 'roe', 1),
+        ('debtToEquity', 'debt_ratio', 0.01),
+        ('marketCap', 'market_cap', 1),
+        ('dividendYield', 'dividend_yield', 1),
+    )
+
+    def _build_financial_metrics(self, symbol: str, info: Dict[str, Any]) -> FinancialMetrics:
+        """info 딕셔너리 → FinancialMetrics 변환"""
         try:
-            yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
-            ticker = yf.Ticker(yf_symbol)
-            info = ticker.info
-            
             metrics = FinancialMetrics()
-            
+
             if info:
-                # 주요 재무 지표 수집
-                if 'trailingPE' in info and info['trailingPE']:
-                    metrics.pe_ratio = Decimal(str(info['trailingPE']))
-                
-                if 'priceToBook' in info and info['priceToBook']:
-                    metrics.pb_ratio = Decimal(str(info['priceToBook']))
-                    
-                if 'returnOnEquity' in info and info['returnOnEquity']:
-                    metrics.roe = Decimal(str(info['returnOnEquity']))
-                
-                if 'debtToEquity' in info and info['debtToEquity']:
-                    metrics.debt_ratio = Decimal(str(info['debtToEquity'] / 100))
-                
-                if 'marketCap' in info and info['marketCap']:
-                    metrics.market_cap = Decimal(str(info['marketCap']))
-                
-                if 'dividendYield' in info and info['dividendYield']:
-                    metrics.dividend_yield = Decimal(str(info['dividendYield']))
-            
+                for key, attr, scale in self._FIN_METRIC_MAP:
+                    value = info.get(key)
+                    if value:
+                        setattr(metrics, attr, Decimal(str(value * scale)))
+
             return metrics
-            
+
         except Exception as e:
             app_logger.error(f"재무 지표 수집 실패: {symbol}, 오류: {str(e)}")
             return FinancialMetrics()
-    
-    def calculate_technical_indicators(self, price_data: List[StockPrice]) -> TechnicalIndicators:
-        """기술적 지표 계산"""
+
+    def _sync_get_financial_metrics(self, symbol: str, market: str) -> FinancialMetrics:
+        """재무 지표 수집 (블로킹 yfinance 호출, 스레드에서 실행)"""
+        yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
+        ticker = self._get_ticker(yf_symbol)
+        info = ticker.info
+        return self._build_financial_metrics(symbol, info)
+
+    async def get_financial_metrics(self, symbol: str, market: str) -> FinancialMetrics:
+        """재무 지표 수집"""
+        try:
+            return await self._cached_fetch(
+                ('metrics', symbol, market), 3600,
+                lambda: asyncio.to_thread(self._sync_get_financial_metrics, symbol, market)
+            )
+        except Exception as e:
+            app_logger.error(f"재무 지표 수집 실패: {symbol}, 오류: {str(e)}")
+            return FinancialMetrics()
+
+    async def get_company_profile(self, symbol: str, market: str) -> tuple:
+        """기업 정보 + 재무 지표 동시 수집
+
+        두 호출 모두 스레드로 넘긴 블로킹 yfinance 조회이므로 gather로
+        겹치면 벽시계 시간이 절반이 된다. 같은 심볼이면 Ticker TTL
+        캐시 덕에 원격 호출 자체도 한 번만 나간다.
+        """
+        return await asyncio.gather(
+            self.get_company_info(symbol, market),
+            self.get_financial_metrics(symbol, market)
+        )
+
+    def calculate_technical_indicators(
+        self,
+        price_data: List[StockPrice],
+        closes: Optional[np.ndarray] = None
+    ) -> TechnicalIndicators:
+        """기술적 지표 계산
+
+        closes가 주어지면(수집 시점의 float64 종가 배열) Decimal→float
+        재변환 없이 그대로 사용한다. price_data 자리에 float64 종가
+        배열(SoA 컬럼)을 직접 넘겨도 된다 — 백테스트처럼 StockPrice
+        객체를 만들 이유가 없는 호출자는 객체 N개 × Decimal 4개 할당을
+        전부 생략할 수 있다. 모든 지표는 같은 연속 버퍼를 공유.
+        """
         try:
+            # SoA 경로: 종가 배열이 곧 입력
+            if isinstance(price_data, np.ndarray):
+                closes = price_data
+
             if len(price_data) < 20:
                 app_logger.warning("기술적 지표 계산을 위한 데이터 부족")
                 return TechnicalIndicators()
-            
-            # 종가 리스트 생성
-            closes = [float(price.close) for price in price_data]
-            
+
+            if closes is None:
+                closes = np.fromiter(
+                    (float(price.close) for price in price_data),
+                    dtype=np.float64, count=len(price_data)
+                )
+
             indicators = TechnicalIndicators()
-            
+
             # RSI 계산 (14일)
             if len(closes) >= 14:
                 rsi = self._calculate_rsi(closes, 14)
                 if rsi:
                     indicators.rsi = Decimal(str(rsi))
-            
-            # 이동평균선 계산
-            if len(closes) >= 20:
-                sma_20 = sum(closes[-20:]) / 20
-                indicators.sma_20 = Decimal(str(sma_20))
-            
+
+            # 이동평균선 계산 (벡터화 reduction)
             if len(closes) >= 50:
-                sma_50 = sum(closes[-50:]) / 50
-                indicators.sma_50 = Decimal(str(sma_50))
-            
+                indicators.sma_50 = Decimal(str(closes[-50:].mean()))
+
             if len(closes) >= 200:
-                sma_200 = sum(closes[-200:]) / 200
-                indicators.sma_200 = Decimal(str(sma_200))
-            
-            # 볼린저 밴드 계산 (20일, 2σ)
+                indicators.sma_200 = Decimal(str(closes[-200:].mean()))
+
+            # 볼린저 밴드 계산 (20일, 2σ) — 중간 밴드가 곧 SMA 20이므로
+            # 커널 한 번으로 두 지표를 채운다 (동일 윈도우 이중 스캔 제거)
             if len(closes) >= 20:
                 bb_upper, bb_middle, bb_lower = self._calculate_bollinger_bands(closes, 20, 2)
                 if bb_upper:
                     indicators.bollinger_upper = Decimal(str(bb_upper))
                     indicators.bollinger_middle = Decimal(str(bb_middle))
                     indicators.bollinger_lower = Decimal(str(bb_lower))
+                    indicators.sma_20 = indicators.bollinger_middle
             
             # MACD 계산 (12, 26, 9)
             if len(closes) >= 26:
@@ -214,103 +553,94 @@ class DataCollector:
             app_logger.error(f"기술적 지표 계산 실패: {str(e)}")
             return TechnicalIndicators()
     
-    def _calculate_rsi(self, prices: List[float], period: int = 14) -> Optional[float]:
-        """RSI 계산"""
-        try:
-            if len(prices) < period + 1:
-                return None
-            
-            deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-            gains = [d if d > 0 else 0 for d in deltas]
-            losses = [-d if d < 0 else 0 for d in deltas]
-            
-            avg_gain = sum(gains[-period:]) / period
-            avg_loss = sum(losses[-period:]) / period
-            
-            if avg_loss == 0:
-                return 100
-            
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
-            
-            return rsi
-            
-        except Exception:
-            return None
-    
-    def _calculate_bollinger_bands(self, prices: List[float], period: int = 20, std_dev: int = 2) -> tuple:
-        """볼린저 밴드 계산"""
-        try:
-            if len(prices) < period:
-                return None, None, None
-            
-            recent_prices = prices[-period:]
-            middle = sum(recent_prices) / period
-            
-            variance = sum([(p - middle) ** 2 for p in recent_prices]) / period
-            std_deviation = variance ** 0.5
-            
-            upper = middle + (std_deviation * std_dev)
-            lower = middle - (std_deviation * std_dev)
-            
-            return upper, middle, lower
-            
-        except Exception:
-            return None, None, None
+    def _calculate_rsi(self, prices: np.ndarray, period: int = 14) -> Optional[float]:
+        """RSI 계산 (JIT 커널 위임)"""
+        return calculate_rsi(prices, period)
+
+    def _calculate_bollinger_bands(self, prices: np.ndarray, period: int = 20, std_dev: int = 2) -> tuple:
+        """볼린저 밴드 계산 (JIT 커널 위임)"""
+        return calculate_bollinger_bands(prices, period, std_dev)
+
+    def _calculate_macd(self, prices: np.ndarray, fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
+        """MACD 계산 (JIT 커널 위임)"""
+        return calculate_macd(prices, fast, slow, signal)
     
-    def _calculate_macd(self, prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9) -> tuple:
-        """MACD 계산"""
-        try:
-            if len(prices) < slow:
-                return None, None, None
-            
-            # 지수 이동평균 계산
-            def calculate_ema(prices, period):
-                multiplier = 2 / (period + 1)
-                ema = prices[0]
-                for price in prices[1:]:
-                    ema = (price - ema) * multiplier + ema
-                return ema
-            
-            ema_fast = calculate_ema(prices[-fast:], fast)
-            ema_slow = calculate_ema(prices[-slow:], slow)
-            
-            macd_line = ema_fast - ema_slow
-            
-            # MACD 히스토리가 충분한 경우 시그널 라인 계산
-            if len(prices) >= slow + signal:
-                # 단순화: 실제로는 MACD 값들의 EMA를 계산해야 함
-                signal_line = macd_line * 0.9  # 근사값
-                histogram = macd_line - signal_line
-            else:
-                signal_line = macd_line
-                histogram = 0
-            
-            return macd_line, signal_line, histogram
-            
-        except Exception:
-            return None, None, None
-    
-    async def get_news_data(self, symbol: str, market: str, limit: int = 10) -> List[Dict[str, Any]]:
-        """뉴스 데이터 수집"""
+    async def _fetch_external_news(self, symbol: str, market: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """외부 뉴스 API(News API·Serper)에서만 뉴스 수집 (yfinance 폴백 제외)"""
         try:
             news_data = []
-            
+
             # News API 사용 (API 키가 있는 경우)
             if settings.news_api_key:
                 news_data.extend(await self._fetch_news_api_data(symbol, market, limit))
-            
-            # Serper API 사용 (API 키가 있는 경우)  
+
+            # Serper API 사용 (API 키가 있는 경우)
             if settings.serper_api_key and len(news_data) < limit:
                 remaining = limit - len(news_data)
                 news_data.extend(await self._fetch_serper_data(symbol, market, remaining))
-            
-            # yfinance 뉴스 (fallback)
-            if len(news_data) < limit:
-                news_data.extend(self._fetch_yfinance_news(symbol, market, limit))
-            
+
             return news_data[:limit]
-            
+
+        except Exception as e:
+            app_logger.error(f"뉴스 데이터 수집 실패: {symbol}, 오류: {str(e)}")
+            return []
+
+    async def _fetch_news_uncached(self, symbol: str, market: str, limit: int) -> List[Dict[str, Any]]:
+        """외부 뉴스 + yfinance 폴백 수집 (캐시 미적용 실제 fetch)"""
+        news_data = await self._fetch_external_news(symbol, market, limit)
+
+        # yfinance 뉴스 (fallback, 블로킹 호출이라 스레드로)
+        if len(news_data) < limit:
+            news_data.extend(
+                await asyncio.to_thread(self._fetch_yfinance_news, symbol, market, limit)
+            )
+
+        return news_data[:limit]
+
+    async def stream_news_data(self, symbol: str, market: str, limit: int = 10) -> AsyncIterator[Dict[str, Any]]:
+        """뉴스 기사를 공급자 응답이 도착하는 대로 스트리밍
+
+        전체 목록이 모일 때까지 기다리지 않고 News API 결과부터
+        즉시 내보내므로, 소비자(감성 분석)의 계산이 후속 Serper·
+        yfinance 수집과 겹친다. 공급자 순서와 limit 상한은
+        get_news_data와 동일하다.
+        """
+        yielded = 0
+        try:
+            if settings.news_api_key:
+                for item in await self._fetch_news_api_data(symbol, market, limit):
+                    if yielded >= limit:
+                        return
+                    yielded += 1
+                    yield item
+
+            if settings.serper_api_key and yielded < limit:
+                for item in await self._fetch_serper_data(symbol, market, limit - yielded):
+                    if yielded >= limit:
+                        return
+                    yielded += 1
+                    yield item
+
+            if yielded < limit:
+                fallback = await asyncio.to_thread(
+                    self._fetch_yfinance_news, symbol, market, limit - yielded
+                )
+                for item in fallback:
+                    if yielded >= limit:
+                        return
+                    yielded += 1
+                    yield item
+
+        except Exception as e:
+            app_logger.error(f"뉴스 스트리밍 실패: {symbol}, 오류: {str(e)}")
+
+    async def get_news_data(self, symbol: str, market: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """뉴스 데이터 수집"""
+        try:
+            return await self._cached_fetch(
+                ('news', symbol, market, limit), 600,
+                lambda: self._fetch_news_uncached(symbol, market, limit)
+            )
         except Exception as e:
             app_logger.error(f"뉴스 데이터 수집 실패: {symbol}, 오류: {str(e)}")
             return []
@@ -325,34 +655,33 @@ class DataCollector:
             else:
                 query = symbol
             
-            url = f"{APIEndpoints.NEWS_API_BASE}/everything"
+            # 호출마다 바뀌는 파라미터만 골격에 얹는다
             params = {
+                **self._news_base_params,
                 'q': query,
-                'sortBy': 'publishedAt',
                 'language': 'ko' if market.upper() == 'KR' else 'en',
-                'pageSize': min(limit, 20),
-                'apiKey': settings.news_api_key
+                'pageSize': min(limit, 20)
             }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        articles = data.get('articles', [])
-                        
-                        news_data = []
-                        for article in articles:
-                            news_data.append({
-                                'title': article.get('title'),
-                                'description': article.get('description'),
-                                'url': article.get('url'),
-                                'published_at': article.get('publishedAt'),
-                                'source': article.get('source', {}).get('name'),
-                                'sentiment': None  # 추후 감성 분석 추가
-                            })
-                        
-                        return news_data
-                    
+
+            session = self._get_aiohttp_session()
+            async with session.get(self._news_everything_url, params=params) as response:
+                if response.status == 200:
+                    data = _decode_json(await response.read())
+                    articles = data.get('articles', [])
+
+                    news_data = []
+                    for article in articles:
+                        news_data.append({
+                            'title': article.get('title'),
+                            'description': article.get('description'),
+                            'url': article.get('url'),
+                            'published_at': article.get('publishedAt'),
+                            'source': article.get('source', {}).get('name'),
+                            'sentiment': None  # 추후 감성 분석 추가
+                        })
+
+                    return news_data
+
             return []
             
         except Exception as e:
@@ -368,67 +697,60 @@ class DataCollector:
             else:
                 query = f"{symbol} stock news"
             
-            headers = {
-                'X-API-KEY': settings.serper_api_key,
-                'Content-Type': 'application/json'
-            }
-            
             data = {
                 'q': query,
                 'num': min(limit, 10)
             }
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(f"{APIEndpoints.SERPER_API_BASE}/news", 
-                                       headers=headers, json=data) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        news_items = result.get('news', [])
-                        
-                        news_data = []
-                        for item in news_items:
-                            news_data.append({
-                                'title': item.get('title'),
-                                'description': item.get('snippet'),
-                                'url': item.get('link'),
-                                'published_at': item.get('date'),
-                                'source': item.get('source'),
-                                'sentiment': None
-                            })
-                        
-                        return news_data
-                    
+
+            session = self._get_aiohttp_session()
+            async with session.post(self._serper_news_url,
+                                    headers=self._serper_headers, json=data) as response:
+                if response.status == 200:
+                    result = _decode_json(await response.read())
+                    news_items = result.get('news', [])
+
+                    news_data = []
+                    for item in news_items:
+                        news_data.append({
+                            'title': item.get('title'),
+                            'description': item.get('snippet'),
+                            'url': item.get('link'),
+                            'published_at': item.get('date'),
+                            'source': item.get('source'),
+                            'sentiment': None
+                        })
+
+                    return news_data
+
             return []
             
         except Exception as e:
             app_logger.error(f"Serper API 데이터 수집 실패: {str(e)}")
             return []
     
+    def _format_yfinance_news(self, news: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """yfinance 뉴스 항목을 내부 뉴스 스키마로 변환"""
+        news_data = []
+        for item in (news or [])[:limit]:
+            news_data.append({
+                'title': item.get('title'),
+                'description': item.get('summary'),
+                'url': item.get('link'),
+                'published_at': datetime.fromtimestamp(item.get('providerPublishTime', 0)).isoformat(),
+                'source': item.get('publisher'),
+                'sentiment': None
+            })
+        return news_data
+
     def _fetch_yfinance_news(self, symbol: str, market: str, limit: int) -> List[Dict[str, Any]]:
         """yfinance에서 뉴스 수집 (fallback)"""
         try:
             yf_symbol = APIEndpoints.get_yfinance_symbol(symbol, market)
-            ticker = yf.Ticker(yf_symbol)
+            ticker = self._get_ticker(yf_symbol)
             news = ticker.news
-            
-            news_data = []
-            for item in news[:limit]:
-                news_data.append({
-                    'title': item.get('title'),
-                    'description': item.get('summary'),
-                    'url': item.get('link'),
-                    'published_at': datetime.fromtimestamp(item.get('providerPublishTime', 0)).isoformat(),
-                    'source': item.get('publisher'),
-                    'sentiment': None
-                })
-            
-            return news_data
-            
+
+            return self._format_yfinance_news(news, limit)
+
         except Exception as e:
             app_logger.error(f"yfinance 뉴스 수집 실패: {str(e)}")
             return []
-    
-    def __del__(self):
-        """세션 정리"""
-        if hasattr(self, 'session'):
-            self.session.close()
\ No newline at end of file
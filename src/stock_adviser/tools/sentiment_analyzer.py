@@ -1,176 +1,314 @@
 from textblob import TextBlob
 import nltk
+
+try:
+    # VADER는 POS 태깅 없이 사전 기반으로 동작해 짧은 뉴스 텍스트에서
+    # TextBlob보다 한 자릿수 빠르다. vaderSentiment 패키지가 없으면
+    # nltk 동봉 구현을 사용하고, 둘 다 불가하면 TextBlob으로 폴백
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+except ImportError:
+    try:
+        from nltk.sentiment.vader import SentimentIntensityAnalyzer
+    except ImportError:
+        SentimentIntensityAnalyzer = None
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from decimal import Decimal
 from datetime import datetime
+import os
 import re
+import time
 
 from ..utils import app_logger
 
+# 전처리 정규식 (모듈 로드 시 1회 컴파일 — 호출마다 re._cache 조회 제거)
+# HTML 태그와 특수 문자 연속을 하나의 교대(alternation) 패턴으로 융합해
+# 텍스트를 두 번이 아닌 한 번만 스캔한다
+_RE_CLEAN = re.compile(r'<[^>]+>|[^\w\s가-힣]+')
+_RE_WS = re.compile(r'\s+')
+# 라틴 문자 존재 검사 — 영어 어휘 사전 기반 분석(VADER/TextBlob)은
+# 한글 전용 텍스트에서 0.0만 반환하므로 해당 비용을 건너뛴다
+_RE_HAS_LATIN = re.compile(r'[A-Za-z]')
+
+
+# 초 단위로 캐시된 ISO 타임스탬프 — 기본값/오류 경로가 타이트 루프에서
+# 반복 호출돼도 datetime 객체 생성·포맷을 초당 1회로 제한한다
+_TS_CACHE = (0.0, '')
+
+
+def _cached_timestamp() -> str:
+    """초 해상도 캐시 타임스탬프 반환"""
+    global _TS_CACHE
+    now = time.time()
+    if now - _TS_CACHE[0] >= 1.0:
+        _TS_CACHE = (now, datetime.now().isoformat(timespec='seconds'))
+    return _TS_CACHE[1]
+
+
+# NLTK 데이터 확인은 프로세스당 1회면 충분 (nltk.data.find는 디스크 I/O)
+_NLTK_READY = False
+
+
+def _ensure_nltk_data():
+    """필요한 NLTK 데이터 다운로드 (프로세스당 1회)"""
+    global _NLTK_READY
+    if _NLTK_READY:
+        return
+    try:
+        nltk.data.find('corpora/stopwords')
+    except LookupError:
+        try:
+            nltk.download('stopwords', quiet=True)
+            nltk.download('punkt', quiet=True)
+            nltk.download('vader_lexicon', quiet=True)
+        except Exception as e:
+            app_logger.warning(f"NLTK 데이터 다운로드 실패: {str(e)}")
+    _NLTK_READY = True
+
 
 class SentimentAnalyzer:
     """감성 분석 도구"""
-    
+
+    # 긍정적 금융 키워드
+    POSITIVE_KEYWORDS = (
+        '상승', '증가', '성장', '개선', '호조', '강세', '급등', '돌파',
+        '수익', '이익', '매출', '실적', '호실적', '흑자', '배당',
+        'growth', 'profit', 'revenue', 'earnings', 'bullish', 'rally',
+        'surge', 'gain', 'rise', 'increase', 'outperform'
+    )
+
+    # 부정적 금융 키워드
+    NEGATIVE_KEYWORDS = (
+        '하락', '감소', '급락', '폭락', '위험', '손실', '적자', '부진',
+        '약세', '하향', '조정', '우려', '불안', '위기', '침체',
+        'decline', 'fall', 'loss', 'bearish', 'crash', 'plunge',
+        'drop', 'decrease', 'risk', 'concern', 'worry', 'crisis'
+    )
+
     def __init__(self):
-        self._ensure_nltk_data()
-        
-    def _ensure_nltk_data(self):
-        """필요한 NLTK 데이터 다운로드"""
-        try:
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
+        _ensure_nltk_data()
+        # VADER 분석기 (1회 생성 — 어휘 사전 로드가 비싸다)
+        self._vader = None
+        if SentimentIntensityAnalyzer is not None:
             try:
-                nltk.download('stopwords', quiet=True)
-                nltk.download('punkt', quiet=True)
-                nltk.download('vader_lexicon', quiet=True)
+                self._vader = SentimentIntensityAnalyzer()
             except Exception as e:
-                app_logger.warning(f"NLTK 데이터 다운로드 실패: {str(e)}")
-    
+                app_logger.warning(f"VADER 초기화 실패, TextBlob 사용: {str(e)}")
+        # 키워드 교대 패턴 — 키워드당 O(텍스트 길이) 부분 문자열 검사
+        # 대신 컴파일된 단일 스캔으로 모든 히트를 찾는다. 긍/부정을
+        # 이름 그룹으로 합쳐 텍스트를 한 번만 훑고 lastgroup으로 집계
+        pos_alt = '|'.join(map(re.escape, self.POSITIVE_KEYWORDS))
+        neg_alt = '|'.join(map(re.escape, self.NEGATIVE_KEYWORDS))
+        # IGNORECASE로 컴파일해 호출마다 text.lower() 전체 복사를 생략
+        self._kw_re = re.compile(
+            f"(?P<pos>{pos_alt})|(?P<neg>{neg_alt})", re.IGNORECASE
+        )
+        # 전처리된 텍스트 → 점수 LRU 캐시 (인스턴스별 — 중복 헤드라인 제거)
+        self._score_text_cached = lru_cache(maxsize=4096)(self._score_text)
+        
+    def _analyze_news_item(self, news: Dict[str, Any]) -> Optional[tuple]:
+        """뉴스 1건 감성 분석 (빈 텍스트면 None)
+
+        기사당 딕셔너리 대신 (제목, 점수, 카테고리, URL, 발행시각)
+        튜플을 반환한다 — 키 해싱 없는 가벼운 레코드로 축적하고,
+        딕셔너리는 직렬화 시점에 한 번만 조립한다.
+        """
+        title = news.get('title', '')
+        description = news.get('description', '')
+
+        # 빈 항목을 먼저 거르고, 결합은 필요한 경우에만 1회 할당
+        if not title and not description:
+            return None
+        if not description:
+            text = title
+        elif not title:
+            text = description
+        else:
+            text = title + " " + description
+        if text.isspace():
+            return None
+
+        # 감성 분석 수행
+        sentiment_score = self._analyze_text_sentiment(text)
+
+        # 카테고리 분류
+        if sentiment_score > 0.1:
+            category = 'positive'
+        elif sentiment_score < -0.1:
+            category = 'negative'
+        else:
+            category = 'neutral'
+
+        return (title, sentiment_score, category, news.get('url'), news.get('published_at'))
+
+    def _summarize_news_sentiment(self, analyzed_items: List[tuple]) -> Dict[str, Any]:
+        """분석된 뉴스 튜플 목록 → 종합 감성 결과"""
+        if not analyzed_items:
+            return self._get_default_sentiment_result()
+
+        # 평균/분산/분포/출력 딕셔너리를 단일 패스로 집계 —
+        # Welford 온라인 알고리즘이라 점수 배열 재스캔이 없다
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        positive_count = 0
+        negative_count = 0
+        analyzed_news = []
+
+        for title, score, category, url, published_at in analyzed_items:
+            count += 1
+            delta = score - mean
+            mean += delta / count
+            m2 += delta * (score - mean)
+
+            if score > 0.1:
+                positive_count += 1
+            elif score < -0.1:
+                negative_count += 1
+
+            # 직렬화 경계에서만 딕셔너리 조립
+            analyzed_news.append({
+                'title': title,
+                'sentiment_score': score,
+                'sentiment_category': category,
+                'url': url,
+                'published_at': published_at
+            })
+
+        distribution = {
+            'positive': positive_count,
+            'negative': negative_count,
+            'neutral': count - positive_count - negative_count
+        }
+
+        # 전체 감성 점수 계산
+        avg_sentiment = mean
+
+        # 신뢰도 계산 (뉴스 개수와 점수 분산 기반)
+        score_variance = m2 / count  # 모분산 (기존 ndarray.var()와 동일)
+        confidence = min(1.0, max(0.1, 1 - (score_variance * 2)))  # 분산이 클수록 신뢰도 낮음
+        confidence *= min(1.0, count / 10)  # 뉴스 개수가 많을수록 신뢰도 높음
+
+        # 전체 카테고리 결정
+        if avg_sentiment > 0.2:
+            overall_category = 'positive'
+        elif avg_sentiment < -0.2:
+            overall_category = 'negative'
+        else:
+            overall_category = 'neutral'
+
+        return {
+            'overall_sentiment': float(avg_sentiment),
+            'overall_category': overall_category,
+            'confidence': float(confidence),
+            'news_count': len(analyzed_news),
+            'sentiment_distribution': distribution,
+            'analyzed_news': analyzed_news,
+            'analysis_timestamp': datetime.now().isoformat()
+        }
+
     def analyze_news_sentiment(self, news_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """뉴스 데이터 감성 분석"""
+        """뉴스 데이터 감성 분석
+
+        기사별 분석은 서로 독립이므로 대량 배치는 프로세스 풀로
+        코어 병렬 처리한다. 임계값 미만이면 풀 오버헤드(직렬화)가
+        이득을 넘어서므로 인라인 루프를 유지한다.
+        """
         try:
             if not news_data:
                 return self._get_default_sentiment_result()
-            
-            total_sentiment = 0.0
-            sentiment_scores = []
-            positive_count = 0
-            negative_count = 0
-            neutral_count = 0
-            
-            analyzed_news = []
-            
-            for news in news_data:
-                title = news.get('title', '')
-                description = news.get('description', '')
-                
-                # 제목과 설명 결합
-                text = f"{title} {description}".strip()
-                
-                if not text:
-                    continue
-                
-                # 감성 분석 수행
-                sentiment_score = self._analyze_text_sentiment(text)
-                sentiment_scores.append(sentiment_score)
-                total_sentiment += sentiment_score
-                
-                # 카테고리 분류
-                if sentiment_score > 0.1:
-                    category = 'positive'
-                    positive_count += 1
-                elif sentiment_score < -0.1:
-                    category = 'negative'
-                    negative_count += 1
-                else:
-                    category = 'neutral'
-                    neutral_count += 1
-                
-                analyzed_news.append({
-                    'title': title,
-                    'sentiment_score': sentiment_score,
-                    'sentiment_category': category,
-                    'url': news.get('url'),
-                    'published_at': news.get('published_at')
-                })
-            
-            if not sentiment_scores:
-                return self._get_default_sentiment_result()
-            
-            # 전체 감성 점수 계산
-            avg_sentiment = total_sentiment / len(sentiment_scores)
-            
-            # 신뢰도 계산 (뉴스 개수와 점수 분산 기반)
-            score_variance = sum((score - avg_sentiment) ** 2 for score in sentiment_scores) / len(sentiment_scores)
-            confidence = min(1.0, max(0.1, 1 - (score_variance * 2)))  # 분산이 클수록 신뢰도 낮음
-            confidence *= min(1.0, len(sentiment_scores) / 10)  # 뉴스 개수가 많을수록 신뢰도 높음
-            
-            # 전체 카테고리 결정
-            if avg_sentiment > 0.2:
-                overall_category = 'positive'
-            elif avg_sentiment < -0.2:
-                overall_category = 'negative'
+
+            if len(news_data) >= _PARALLEL_THRESHOLD:
+                analyzed_items = [
+                    entry for entry in _get_article_pool().map(
+                        _analyze_item_worker, news_data, chunksize=16
+                    )
+                    if entry is not None
+                ]
             else:
-                overall_category = 'neutral'
-            
-            return {
-                'overall_sentiment': float(avg_sentiment),
-                'overall_category': overall_category,
-                'confidence': float(confidence),
-                'news_count': len(analyzed_news),
-                'sentiment_distribution': {
-                    'positive': positive_count,
-                    'negative': negative_count,
-                    'neutral': neutral_count
-                },
-                'analyzed_news': analyzed_news,
-                'analysis_timestamp': datetime.now().isoformat()
-            }
-            
+                analyzed_items = []
+                for news in news_data:
+                    entry = self._analyze_news_item(news)
+                    if entry is not None:
+                        analyzed_items.append(entry)
+
+            return self._summarize_news_sentiment(analyzed_items)
+
         except Exception as e:
             app_logger.error(f"뉴스 감성 분석 실패: {str(e)}")
             return self._get_default_sentiment_result()
-    
-    def _analyze_text_sentiment(self, text: str) -> float:
-        """텍스트 감성 분석"""
+
+    async def analyze_news_sentiment_stream(self, news_stream) -> Dict[str, Any]:
+        """스트리밍 뉴스 감성 분석
+
+        async 이터레이터에서 기사가 도착하는 대로 분석해, 네트워크가
+        다음 공급자(Serper/yfinance)를 끌어오는 동안 감성 계산이
+        겹치게 한다. 집계 결과는 리스트 기반 경로와 동일하다.
+        """
         try:
-            # 텍스트 전처리
-            cleaned_text = self._preprocess_text(text)
-            
-            # TextBlob을 사용한 감성 분석
-            blob = TextBlob(cleaned_text)
-            sentiment = blob.sentiment.polarity
-            
-            # 금융 특화 키워드 가중치 적용
-            sentiment = self._apply_financial_keywords_weight(cleaned_text, sentiment)
-            
-            # -1.0 ~ 1.0 범위로 정규화
-            return max(-1.0, min(1.0, sentiment))
-            
+            analyzed_items = []
+            async for news in news_stream:
+                entry = self._analyze_news_item(news)
+                if entry is not None:
+                    analyzed_items.append(entry)
+
+            return self._summarize_news_sentiment(analyzed_items)
+
         except Exception as e:
-            app_logger.error(f"텍스트 감성 분석 실패: {str(e)}")
-            return 0.0
+            app_logger.error(f"뉴스 감성 분석 실패: {str(e)}")
+            return self._get_default_sentiment_result()
     
-    def _preprocess_text(self, text: str) -> str:
-        """텍스트 전처리"""
-        try:
-            # HTML 태그 제거
-            text = re.sub(r'<[^>]+>', '', text)
-            
-            # 특수 문자 정리 (기본적인 것만)
-            text = re.sub(r'[^\w\s가-힣]', ' ', text)
-            
-            # 여러 공백을 하나로
-            text = re.sub(r'\s+', ' ', text)
-            
-            return text.strip()
-            
-        except Exception:
-            return text
+    def _analyze_text_sentiment(self, text: str) -> float:
+        """텍스트 감성 분석
+
+        통신사 기사·신디케이션으로 같은 헤드라인이 반복되는 피드가
+        많아, 전처리된 텍스트를 키로 점수를 LRU 캐시한다.
+
+        드문 실패는 analyze_news_sentiment의 바깥 try/except가 처리
+        하므로 여기서는 예외를 삼키지 않는다 (핫 루프 단순화).
+        """
+        cleaned_text = self._preprocess_text(text)
+        return self._score_text_cached(cleaned_text)
+
+    def _score_text(self, cleaned_text: str) -> float:
+        """전처리된 텍스트의 감성 점수 계산 (캐시 대상 순수 함수)"""
+        # 한글 전용 텍스트는 영어 사전 경로를 생략하고
+        # 한국어 키워드 가중치만으로 점수를 계산
+        if not _RE_HAS_LATIN.search(cleaned_text):
+            sentiment = 0.0
+        # 감성 분석 — VADER 우선 (기사마다 새 파이프라인을 만드는
+        # TextBlob과 달리 사전 조회만 수행), 불가 시 TextBlob
+        elif self._vader is not None:
+            sentiment = self._vader.polarity_scores(cleaned_text)['compound']
+        else:
+            sentiment = TextBlob(cleaned_text).sentiment.polarity
+
+        # 금융 특화 키워드 가중치 적용
+        sentiment = self._apply_financial_keywords_weight(cleaned_text, sentiment)
+
+        # -1.0 ~ 1.0 범위로 정규화
+        return max(-1.0, min(1.0, sentiment))
     
+    def _preprocess_text(self, text: str) -> str:
+        """텍스트 전처리 (컴파일된 정규식만 사용 — 예외 발생 여지 없음)"""
+        # HTML 태그 제거 + 특수 문자 정리 (융합 단일 패스)
+        text = _RE_CLEAN.sub(' ', text)
+
+        # 여러 공백을 하나로
+        text = _RE_WS.sub(' ', text)
+
+        return text.strip()
+
+
     def _apply_financial_keywords_weight(self, text: str, base_sentiment: float) -> float:
         """금융 특화 키워드 가중치 적용"""
         try:
-            text_lower = text.lower()
-            
-            # 긍정적 금융 키워드
-            positive_keywords = [
-                '상승', '증가', '성장', '개선', '호조', '강세', '급등', '돌파',
-                '수익', '이익', '매출', '실적', '호실적', '흑자', '배당',
-                'growth', 'profit', 'revenue', 'earnings', 'bullish', 'rally',
-                'surge', 'gain', 'rise', 'increase', 'outperform'
-            ]
-            
-            # 부정적 금융 키워드  
-            negative_keywords = [
-                '하락', '감소', '급락', '폭락', '위험', '손실', '적자', '부진',
-                '약세', '하향', '조정', '우려', '불안', '위기', '침체',
-                'decline', 'fall', 'loss', 'bearish', 'crash', 'plunge',
-                'drop', 'decrease', 'risk', 'concern', 'worry', 'crisis'
-            ]
-            
-            positive_count = sum(1 for keyword in positive_keywords if keyword in text_lower)
-            negative_count = sum(1 for keyword in negative_keywords if keyword in text_lower)
+            # 통합 패턴의 단일 스캔으로 긍/부정 히트를 동시에 집계
+            counts = {'pos': 0, 'neg': 0}
+            for match in self._kw_re.finditer(text):
+                counts[match.lastgroup] += 1
+            positive_count = counts['pos']
+            negative_count = counts['neg']
             
             # 키워드 가중치 적용
             keyword_weight = (positive_count - negative_count) * 0.1
@@ -219,9 +357,9 @@ class SentimentAnalyzer:
             
             return {
                 'symbol': symbol,
-                'sentiment_score': Decimal(str(overall_score)),
+                'sentiment_score': float(overall_score),
                 'sentiment_category': overall_category,
-                'confidence': Decimal(str(overall_confidence)),
+                'confidence': float(overall_confidence),
                 'news_sentiment': news_sentiment,
                 'social_sentiment': social_sentiment,
                 'analysis_timestamp': datetime.now().isoformat()
@@ -240,17 +378,42 @@ class SentimentAnalyzer:
             'news_count': 0,
             'sentiment_distribution': {'positive': 0, 'negative': 0, 'neutral': 0},
             'analyzed_news': [],
-            'analysis_timestamp': datetime.now().isoformat()
+            'analysis_timestamp': _cached_timestamp()
         }
     
     def _get_default_sentiment_summary(self, symbol: str) -> Dict[str, Any]:
         """기본 감성 분석 종합 결과"""
         return {
             'symbol': symbol,
-            'sentiment_score': Decimal('0.0'),
+            'sentiment_score': 0.0,
             'sentiment_category': 'neutral',
-            'confidence': Decimal('0.1'),
+            'confidence': 0.1,
             'news_sentiment': self._get_default_sentiment_result(),
             'social_sentiment': None,
-            'analysis_timestamp': datetime.now().isoformat()
-        }
\ No newline at end of file
+            'analysis_timestamp': _cached_timestamp()
+        }
+
+# --- 대량 배치용 프로세스 풀 헬퍼 ---
+# 기사별 분석은 순수 CPU 작업이라 GIL을 우회하는 프로세스 풀이 유효하다.
+# 워커 프로세스는 분석기를 1개만 만들어 재사용한다.
+
+_PARALLEL_THRESHOLD = 64
+
+_worker_analyzer: Optional[SentimentAnalyzer] = None
+_article_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _analyze_item_worker(news: Dict[str, Any]) -> Optional[tuple]:
+    """프로세스 풀 워커 — 프로세스당 SentimentAnalyzer 싱글턴"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = SentimentAnalyzer()
+    return _worker_analyzer._analyze_news_item(news)
+
+
+def _get_article_pool() -> ProcessPoolExecutor:
+    """공유 프로세스 풀 반환 (첫 대량 배치에서 지연 생성)"""
+    global _article_pool
+    if _article_pool is None:
+        _article_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _article_pool
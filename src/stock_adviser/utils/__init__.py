@@ -8,6 +8,15 @@ from .config import (
     validate_api_keys
 )
 
+from .backstories import get_backstory
+
+from .timeutils import today_str
+
+from .llm_cache import (
+    LLMResultCache,
+    llm_cache
+)
+
 from .logger import (
     setup_logger,
     get_logger,
@@ -27,6 +36,10 @@ __all__ = [
     'APIEndpoints',
     'get_market_config',
     'validate_api_keys',
+    'get_backstory',
+    'today_str',
+    'LLMResultCache',
+    'llm_cache',
     'setup_logger',
     'get_logger',
     'StockAnalysisLogger',
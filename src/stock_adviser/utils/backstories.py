@@ -0,0 +1,18 @@
+from functools import lru_cache
+from pathlib import Path
+
+_BACKSTORY_DIR = Path(__file__).parent.parent / "resources" / "backstories"
+
+
+@lru_cache(maxsize=None)
+def get_backstory(role: str) -> str:
+    """역할별 상세 배경 설명 조회
+
+    프롬프트 토큰 절약을 위해 Agent에는 요약 backstory만 싣고,
+    상세 프로필은 필요할 때 이 함수(또는 이를 감싼 도구)로 가져온다.
+    """
+    path = _BACKSTORY_DIR / f"{role}.md"
+    try:
+        return path.read_text(encoding='utf-8')
+    except OSError:
+        return ""
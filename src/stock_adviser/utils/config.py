@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Optional
 from pathlib import Path
 from pydantic_settings import BaseSettings
@@ -26,6 +27,7 @@ class Settings(BaseSettings):
     environment: str = Field(default="development", description="Environment (development, test, production)")
     log_level: str = Field(default="INFO", description="Log level")
     debug: bool = Field(default=False, description="Debug mode")
+    debug_store_raw: bool = Field(default=False, description="Store full raw LLM output in analysis results")
     
     # API Configuration
     api_rate_limit: int = Field(default=100, description="API rate limit per minute")
@@ -45,9 +47,12 @@ class Settings(BaseSettings):
     confidence_interval: float = Field(default=0.95, description="Statistical confidence interval")
     
     # CrewAI Settings
-    crewai_verbose: bool = Field(default=True, description="CrewAI verbose mode")
+    crewai_verbose: bool = Field(default=False, description="CrewAI verbose mode")
     crewai_memory: bool = Field(default=True, description="CrewAI memory enabled")
     crewai_max_iter: int = Field(default=5, description="CrewAI max iterations")
+    max_concurrent_llm: int = Field(default=4, description="Max concurrent LLM calls (provider rate limit)")
+    max_concurrent_analyses: int = Field(default=8, description="Max concurrent stock analyses in portfolio mode")
+    manager_llm: str = Field(default="gpt-4o-mini", description="Manager LLM for hierarchical crews")
     
     # Security
     jwt_secret_key: Optional[str] = Field(default=None, description="JWT secret key")
@@ -125,16 +130,22 @@ class APIEndpoints:
     SERPER_API_BASE = "https://google.serper.dev"
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def get_yfinance_symbol(symbol: str, market: str) -> str:
-        """yfinance용 심볼 변환"""
+        """yfinance용 심볼 변환
+
+        분석 한 번에 4개 메서드가 같은 (symbol, market) 쌍으로
+        호출하므로 변환 결과를 캐시해 문자열 검사/포맷을 1회로 줄인다.
+        """
         if market.upper() == 'KR':
             if not symbol.endswith('.KS') and not symbol.endswith('.KQ'):
                 # 기본적으로 KOSPI로 설정
                 return f"{symbol}.KS"
         return symbol
 
+@lru_cache(maxsize=8)
 def get_market_config(market: str) -> dict:
-    """시장별 설정 반환"""
+    """시장별 설정 반환 (시장 코드 몇 개뿐이라 조회 결과를 캐시)"""
     market = market.upper()
     if market == 'KR':
         return MarketConfig.KOREAN_MARKET
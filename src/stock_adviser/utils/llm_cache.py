@@ -0,0 +1,79 @@
+import hashlib
+import json
+import pickle
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from .config import settings
+from .logger import app_logger
+
+
+class LLMResultCache:
+    """LLM 분석 결과 디스크 캐시
+
+    동일한 입력으로 같은 날 재분석을 요청하면 전체 LLM 호출을 건너뛰고
+    저장된 결과를 반환한다. 키는 분석 입력 전체의 SHA-256 해시.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, default_ttl: int = 86400):
+        self.cache_dir = Path(cache_dir) if cache_dir else settings.project_root / ".cache" / "llm"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.default_ttl = default_ttl
+
+    @staticmethod
+    def make_key(**inputs: Any) -> str:
+        """분석 입력으로부터 결정적 캐시 키 생성"""
+        payload = json.dumps(inputs, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (만료되었거나 없으면 None)"""
+        path = self._entry_path(key)
+        try:
+            if not path.exists():
+                return None
+
+            with open(path, 'rb') as f:
+                expires_at, value = pickle.load(f)
+
+            if expires_at is not None and time.time() > expires_at:
+                path.unlink(missing_ok=True)
+                return None
+
+            return value
+
+        except Exception as e:
+            app_logger.warning(f"LLM 캐시 조회 실패: {key[:12]}, 오류: {str(e)}")
+            return None
+
+    def set(self, key: str, value: Any, expire: Optional[int] = None) -> None:
+        """캐시 저장 (expire 초 후 만료, 기본 24시간)"""
+        path = self._entry_path(key)
+        try:
+            ttl = expire if expire is not None else self.default_ttl
+            expires_at = time.time() + ttl if ttl else None
+
+            with open(path, 'wb') as f:
+                pickle.dump((expires_at, value), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        except Exception as e:
+            app_logger.warning(f"LLM 캐시 저장 실패: {key[:12]}, 오류: {str(e)}")
+
+    def clear(self) -> int:
+        """캐시 전체 삭제, 삭제한 항목 수 반환"""
+        removed = 0
+        for path in self.cache_dir.glob("*.pkl"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+# 글로벌 캐시 인스턴스
+llm_cache = LLMResultCache()
@@ -0,0 +1,18 @@
+from datetime import date
+
+# (서수 날짜, 문자열) — 프로세스 내 일 단위 캐시
+_today_cache = (0, "")
+
+
+def today_str() -> str:
+    """오늘 날짜를 '%Y-%m-%d' 문자열로 반환 (일 단위 메모이즈)
+
+    태스크 설명·캐시 키 등 핫 패스에서 매 호출마다 strftime을
+    반복하지 않도록 같은 날에는 캐시된 문자열을 재사용한다.
+    """
+    global _today_cache
+    today = date.today()
+    ordinal = today.toordinal()
+    if _today_cache[0] != ordinal:
+        _today_cache = (ordinal, today.isoformat())
+    return _today_cache[1]
@@ -3,8 +3,24 @@ from unittest.mock import Mock, patch, AsyncMock
 import asyncio
 from decimal import Decimal
 
+import numpy as np
+
 from src.stock_adviser.tools import SentimentAnalyzer, DataCollector
 
+# 지표 테스트용 가격 데이터 — setup_method마다 리스트를 다시 만들지
+# 않도록 모듈 스코프 float64 배열로 공유 (지표 래퍼는 ndarray를
+# 복사 없이 그대로 사용한다)
+RSI_PRICES = np.array(
+    [100, 102, 101, 103, 102, 104, 103, 105, 104, 106, 105, 107, 106, 108, 107],
+    dtype=np.float64
+)
+BB_PRICES = np.array(
+    [100, 102, 101, 103, 102, 104, 103, 105, 104, 106,
+     105, 107, 106, 108, 107, 109, 108, 110, 109, 111],
+    dtype=np.float64
+)
+MACD_PRICES = np.arange(100, 130, dtype=np.float64)  # 30개 가격 데이터
+
 
 class TestSentimentAnalyzer:
     """감성 분석 도구 테스트"""
@@ -107,9 +123,9 @@ class TestSentimentAnalyzer:
         summary = self.analyzer.get_sentiment_summary('TEST', news_sentiment)
         
         assert summary['symbol'] == 'TEST'
-        assert isinstance(summary['sentiment_score'], Decimal)
+        assert isinstance(summary['sentiment_score'], float)
         assert summary['sentiment_category'] == 'positive'
-        assert isinstance(summary['confidence'], Decimal)
+        assert isinstance(summary['confidence'], float)
 
 
 class TestDataCollector:
@@ -118,7 +134,17 @@ class TestDataCollector:
     def setup_method(self):
         """테스트 준비"""
         self.collector = DataCollector()
-    
+
+    @pytest.fixture(scope='class', autouse=True)
+    def mock_yf(self):
+        """yfinance.Ticker 패치를 클래스 전체에 1회만 설치/해제
+
+        테스트마다 with patch(...)를 여닫는 대신 공유 mock을 쓰고,
+        각 테스트는 필요한 .info만 덮어쓴다.
+        """
+        with patch('yfinance.Ticker') as mock_ticker:
+            yield mock_ticker
+
     def test_data_collector_creation(self):
         """데이터 수집기 생성 테스트"""
         assert self.collector is not None
@@ -126,10 +152,7 @@ class TestDataCollector:
     
     def test_rsi_calculation(self):
         """RSI 계산 테스트"""
-        # 테스트 가격 데이터
-        prices = [100, 102, 101, 103, 102, 104, 103, 105, 104, 106, 105, 107, 106, 108, 107]
-        
-        rsi = self.collector._calculate_rsi(prices, 14)
+        rsi = self.collector._calculate_rsi(RSI_PRICES, 14)
         
         assert rsi is not None
         assert 0 <= rsi <= 100
@@ -144,10 +167,7 @@ class TestDataCollector:
     
     def test_bollinger_bands_calculation(self):
         """볼린저 밴드 계산 테스트"""
-        prices = [100, 102, 101, 103, 102, 104, 103, 105, 104, 106, 
-                 105, 107, 106, 108, 107, 109, 108, 110, 109, 111]
-        
-        upper, middle, lower = self.collector._calculate_bollinger_bands(prices, 20, 2)
+        upper, middle, lower = self.collector._calculate_bollinger_bands(BB_PRICES, 20, 2)
         
         assert upper is not None
         assert middle is not None  
@@ -156,67 +176,91 @@ class TestDataCollector:
     
     def test_macd_calculation(self):
         """MACD 계산 테스트"""
-        prices = list(range(100, 130))  # 30개 가격 데이터
-        
-        macd, signal, histogram = self.collector._calculate_macd(prices, 12, 26, 9)
+        macd, signal, histogram = self.collector._calculate_macd(MACD_PRICES, 12, 26, 9)
         
         assert macd is not None
         assert signal is not None
         assert histogram is not None
     
     @pytest.mark.asyncio
-    async def test_get_company_info_mock(self):
+    async def test_get_company_info_mock(self, mock_yf):
         """기업 정보 수집 테스트 (Mock)"""
-        with patch('yfinance.Ticker') as mock_ticker:
-            # Mock 데이터 설정
-            mock_info = {
-                'longName': '삼성전자',
-                'sector': 'Technology',
-                'industry': 'Consumer Electronics'
-            }
-            mock_ticker.return_value.info = mock_info
-            
-            result = await self.collector.get_company_info('005930', 'KR')
-            
-            assert result is not None
-            assert result.name == '삼성전자'
-            assert result.sector == 'Technology'
-            assert result.market == 'KR'
-    
-    @pytest.mark.asyncio  
-    async def test_get_financial_metrics_mock(self):
+        # Mock 데이터 설정
+        mock_info = {
+            'longName': '삼성전자',
+            'sector': 'Technology',
+            'industry': 'Consumer Electronics'
+        }
+        mock_yf.return_value.info = mock_info
+
+        result = await self.collector.get_company_info('005930', 'KR')
+
+        assert result is not None
+        assert result.name == '삼성전자'
+        assert result.sector == 'Technology'
+        assert result.market == 'KR'
+
+    @pytest.mark.asyncio
+    async def test_get_financial_metrics_mock(self, mock_yf):
         """재무 지표 수집 테스트 (Mock)"""
-        with patch('yfinance.Ticker') as mock_ticker:
-            mock_info = {
-                'trailingPE': 15.5,
-                'priceToBook': 1.2,
-                'returnOnEquity': 0.15,
-                'marketCap': 1000000000
-            }
-            mock_ticker.return_value.info = mock_info
-            
-            result = await self.collector.get_financial_metrics('005930', 'KR')
-            
-            assert result is not None
-            assert result.pe_ratio == Decimal('15.5')
-            assert result.pb_ratio == Decimal('1.2')
-            assert result.roe == Decimal('0.15')
+        mock_info = {
+            'trailingPE': 15.5,
+            'priceToBook': 1.2,
+            'returnOnEquity': 0.15,
+            'marketCap': 1000000000
+        }
+        mock_yf.return_value.info = mock_info
+
+        result = await self.collector.get_financial_metrics('005930', 'KR')
+
+        assert result is not None
+        assert result.pe_ratio == Decimal('15.5')
+        assert result.pb_ratio == Decimal('1.2')
+        assert result.roe == Decimal('0.15')
     
+    def test_incremental_indicators_match_batch(self):
+        """증분 지표 상태가 배치 계산 경로와 수치적으로 일치하는지 검증"""
+        from src.stock_adviser.tools.data_collector import _IndicatorState
+
+        closes = np.concatenate([BB_PRICES, MACD_PRICES])  # 50개 종가
+
+        # Wilder 시드: 첫 RSI_PERIOD개 델타의 단순 평균 —
+        # 이 시점의 RSI는 배치 _calculate_rsi와 정확히 같아야 한다
+        state = _IndicatorState()
+        seed_len = _IndicatorState.RSI_PERIOD + 1
+        for close in closes[:seed_len]:
+            state.update(float(close))
+
+        deltas = np.diff(closes[:seed_len])
+        assert state.avg_gain == pytest.approx(np.maximum(deltas, 0.0).mean())
+        assert state.avg_loss == pytest.approx(np.maximum(-deltas, 0.0).mean())
+
+        expected_rsi = self.collector._calculate_rsi(closes[:seed_len], 14)
+        incremental_rsi = 100 - 100 / (1 + state.avg_gain / state.avg_loss)
+        assert incremental_rsi == pytest.approx(expected_rsi)
+
+        # 전체 시리즈 반영 후 SMA/볼린저/MACD 스냅샷은 배치 커널과
+        # 같은 윈도우/점화식이므로 값이 일치해야 한다
+        for close in closes[seed_len:]:
+            state.update(float(close))
+        snapshot = state.snapshot()
+        assert snapshot is not None
+
+        bb_upper, bb_middle, bb_lower = self.collector._calculate_bollinger_bands(closes, 20, 2)
+        assert float(snapshot.sma_20) == pytest.approx(bb_middle)
+        assert float(snapshot.bollinger_upper) == pytest.approx(bb_upper)
+        assert float(snapshot.bollinger_lower) == pytest.approx(bb_lower)
+
+        macd, macd_signal, histogram = self.collector._calculate_macd(closes)
+        assert float(snapshot.macd) == pytest.approx(macd)
+        assert float(snapshot.macd_signal) == pytest.approx(macd_signal)
+        assert float(snapshot.macd_histogram) == pytest.approx(histogram)
+
     def test_calculate_technical_indicators_insufficient_data(self):
-        """기술적 지표 계산 - 데이터 부족 테스트"""
-        from src.stock_adviser.models import StockPrice
-        from datetime import datetime
-        
-        # 10개만 제공 (20개 미만)
-        price_data = []
-        for i in range(10):
-            price = StockPrice(
-                open=Decimal('100'), high=Decimal('105'), 
-                low=Decimal('95'), close=Decimal(str(100 + i)),
-                volume=1000, timestamp=datetime.now()
-            )
-            price_data.append(price)
-        
+        """기술적 지표 계산 - 데이터 부족 테스트 (SoA 종가 배열 경로)"""
+        # 10개만 제공 (20개 미만) — 종가 컬럼 배열을 직접 전달
+        price_data = np.arange(100, 110, dtype=np.float64)
+
         indicators = self.collector.calculate_technical_indicators(price_data)
         
         # 데이터 부족으로 대부분 None이어야 함
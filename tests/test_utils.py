@@ -4,7 +4,8 @@ from unittest.mock import patch
 
 from src.stock_adviser.utils import (
     settings, get_settings, validate_api_keys,
-    get_market_config, APIEndpoints
+    get_market_config, APIEndpoints,
+    setup_logger, get_logger, StockAnalysisLogger, PerformanceLogger
 )
 
 
@@ -86,8 +87,6 @@ class TestLogger:
     
     def test_logger_creation(self):
         """로거 생성 테스트"""
-        from src.stock_adviser.utils import setup_logger, get_logger
-        
         # 새로운 로거 생성
         logger = setup_logger('test_logger', console_output=True, file_output=False)
         
@@ -100,8 +99,6 @@ class TestLogger:
     
     def test_analysis_logger(self):
         """분석 로거 테스트"""
-        from src.stock_adviser.utils import StockAnalysisLogger
-        
         analysis_logger = StockAnalysisLogger('test_analysis')
         
         assert analysis_logger is not None
@@ -117,8 +114,6 @@ class TestLogger:
     
     def test_performance_logger(self):
         """성능 로거 테스트"""
-        from src.stock_adviser.utils import PerformanceLogger
-        
         perf_logger = PerformanceLogger('test_performance')
         
         assert perf_logger is not None